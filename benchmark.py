@@ -0,0 +1,367 @@
+"""Zestaw testów wydajnościowych funkcji z plików labN/main.py.
+
+Zastępuje komórki %timeit/%memit z notatników i może być uruchamiany bez Jupytera.
+Dla każdej funkcji wykonywany jest przegląd rozmiarów problemu, a wyniki (czas
+wykonania i szczytowe zużycie pamięci) zapisywane są do pliku JSON.
+
+Przykłady:
+    python benchmark.py run -o baseline.json
+    python benchmark.py run --quick --filter lab8
+    python benchmark.py compare baseline.json current.json --threshold 0.2
+"""
+import argparse
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_lab(lab: str):
+    """Funkcja importująca moduł labN/main.py pod unikalną nazwą (wszystkie moduły nazywają się main).
+
+    Parameters:
+    lab(str): nazwa katalogu, np. 'lab4'
+
+    Results:
+    module: zaimportowany moduł
+    """
+    name = '{}_main'.format(lab)
+    if name not in sys.modules:
+        # rejestracja w sys.modules pod tą samą nazwą, której używają moduły importujące
+        # wspólne funkcje z innych laboratoriów (_load_lab), więc każdy moduł ładowany jest raz
+        path = os.path.join(ROOT, lab, 'main.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# Każdy przypadek: (lab, nazwa, rozmiary, setup). Funkcja setup(moduł, rozmiar)
+# przygotowuje dane poza pomiarem i zwraca bezargumentową funkcję do zmierzenia.
+CASES: List[Tuple[str, str, List[int], Callable]] = []
+
+
+def case(lab: str, name: str, sizes: List[int]):
+    def register(setup: Callable) -> Callable:
+        CASES.append((lab, name, sizes, setup))
+        return setup
+    return register
+
+
+@case('lab1', 'fib', [100, 10000, 100000])
+def _fib(main, n):
+    return lambda: main.fib(n)
+
+
+@case('lab1', 'custom_matrix', [100, 1000, 3000])
+def _custom_matrix(main, n):
+    return lambda: main.custom_matrix(n, n)
+
+
+@case('lab1', 'matrix_calculations', [1, 1000, 100000])
+def _matrix_calculations(main, n):
+    a = np.linspace(-5, 5, n)
+    return lambda: main.matrix_calculations(a)
+
+
+@case('lab3', 'coskx2', [10, 100, 1000])
+def _coskx2(main, k):
+    x = np.linspace(0, 10, 1000)
+    return lambda: main.coskx2_table(k, x)
+
+
+@case('lab3', 'exponential', [10, 50, 200])
+def _exponential(main, n):
+    x = np.linspace(-5, 5, 10000)
+    return lambda: main.exponential_partial_sums(x, n)
+
+
+@case('lab3', 'pi', [1000, 100000, 10000000])
+def _pi(main, n):
+    return lambda: main.pi_curve(n)
+
+
+@case('lab4', 'barycentric_inte', [1000, 100000, 1000000])
+def _barycentric_inte(main, n):
+    xi = main.chebyshev_nodes(100)
+    wi = main.bar_czeb_weights(100)
+    yi = main.f1(xi)
+    x = np.linspace(-1, 1, n)
+    return lambda: main.barycentric_inte(xi, yi, wi, x)
+
+
+@case('lab5', 'cubic_spline', [100, 10000, 1000000])
+def _cubic_spline(main, n):
+    x = np.linspace(0, 10, n)
+    y = np.sin(x)
+    return lambda: main.cubic_spline(x, y)
+
+
+@case('lab5', 'jacobi', [10, 50, 100])
+def _lab5_jacobi(main, n):
+    np.random.seed(0)
+    A = np.random.rand(n, n) + n * np.eye(n)
+    b = np.random.rand(n)
+    return lambda: main.jacobi(A, b, np.zeros(n), tol=1e-10, n_iterations=100)
+
+
+@case('lab6', 'create_matrix_from_A', [10, 100, 400])
+def _create_matrix_from_A(main, n):
+    A, _ = main.random_matrix_Ab(n, seed=0)
+    s = main.log_sing_value(n, 0, 5)
+    return lambda: main.create_matrix_from_A(A, s)
+
+
+@case('lab6', 'residual_norm', [100, 1000, 3000])
+def _residual_norm(main, n):
+    A, b = main.random_matrix_Ab(n, seed=0)
+    x = np.random.default_rng(1).random(n)
+    return lambda: main.residual_norm(A, x, b)
+
+
+@case('lab7', 'square_from_rectan', [10, 100, 1000])
+def _square_from_rectan(main, n):
+    A, b = main.spare_matrix_Abt(10 * n, n)
+    return lambda: main.square_from_rectan(A, b)
+
+
+@case('lab8', 'solve_jacobi', [100, 500, 2000])
+def _solve_jacobi(main, n):
+    A, b = main.diag_dominant_matrix_A_b(n, seed=0)
+    x0 = np.zeros(n)
+    return lambda: main.solve_jacobi(A, b, x0, maxiter=100)
+
+
+@case('lab8', 'solve_jacobi_block', [1, 16, 128])
+def _solve_jacobi_block(main, k):
+    A, b = main.diag_dominant_matrix_A_b(1000, seed=0)
+    B = np.random.default_rng(1).random((1000, k)) * b[:, None]
+    return lambda: main.solve_jacobi(A, B, np.zeros_like(B), maxiter=100)
+
+
+@case('lab8', 'block_jacobi_factor', [1000, 4000])
+def _block_jacobi_factor(main, n):
+    A, _ = main.diag_dominant_matrix_A_b(n, seed=0)
+    A = A.astype(float)
+    return lambda: main.BlockJacobi(A)
+
+
+@case('lab8', 'block_jacobi_sweep', [1, 2, 4, 8])
+def _block_jacobi_sweep(main, workers):
+    # stały układ 4000x4000 (8 bloków po 500 wierszy) rozłożony poza pomiarem, zmienna liczba wątków;
+    # mierzone jest dokładnie 10 iteracji (epsilon=0.0), więc czas dla kolejnych rozmiarów pokazuje
+    # przyspieszenie samych iteracji (miarodajne tylko na maszynie wielordzeniowej, por. meta['cpu_count'])
+    A, b = main.diag_dominant_matrix_A_b(4000, seed=0)
+    solver = main.BlockJacobi(A.astype(float))
+    x0 = np.zeros(4000)
+    return lambda: solver.solve(b, x0, epsilon=0.0, maxiter=10, workers=workers)
+
+
+@case('lab8', 'solve_gmres', [100, 500, 2000])
+def _solve_gmres(main, n):
+    A, b = main.diag_dominant_matrix_A_b(n, seed=0)
+    x0 = np.zeros(n)
+    return lambda: main.solve_gmres(A, b, x0, maxiter=100, M=main.jacobi_preconditioner(A))
+
+
+@case('lab8', 'solve_bicgstab', [100, 500, 2000])
+def _solve_bicgstab(main, n):
+    A, b = main.diag_dominant_matrix_A_b(n, seed=0)
+    x0 = np.zeros(n)
+    return lambda: main.solve_bicgstab(A, b, x0, maxiter=100, M=main.jacobi_preconditioner(A))
+
+
+@case('lab8', 'diag_dominant_matrix_A_b', [100, 1000, 5000])
+def _diag_dominant_matrix_A_b(main, n):
+    return lambda: main.diag_dominant_matrix_A_b(n, seed=0)
+
+
+@case('lab8', 'is_symmetric', [50, 200, 500])
+def _is_symmetric(main, n):
+    A, _ = main.symmetric_matrix_A_b(n, seed=0)
+    return lambda: main.is_symmetric(A)
+
+
+@case('lab8', 'is_diag_dominant', [50, 200, 500])
+def _is_diag_dominant(main, n):
+    A, _ = main.diag_dominant_matrix_A_b(n, seed=0)
+    return lambda: main.is_diag_dominant(A)
+
+
+@case('lab9', 'bisection', [10, 100, 1000])
+def _bisection(main, n):
+    return lambda: main.bisection(0.5, 2, main.fun, 1e-14, n)
+
+
+@case('lab9', 'newton', [10, 100, 1000])
+def _newton(main, n):
+    return lambda: main.newton(main.fun, main.dfun, main.ddfun, 0.5, 2, 1e-14, n)
+
+
+@case('lab10', 'frob_a', [5, 20, 80])
+def _frob_a(main, n):
+    wsp = np.linspace(1, 2, n)
+    return lambda: main.frob_a(wsp)
+
+
+@case('lab12', 'solve_euler', [100, 1000, 10000])
+def _solve_euler(main, n):
+    t = np.linspace(0, 1, n)
+    return lambda: main.solve_euler(lambda t, y: -y, t, 1.0)
+
+
+def measure(func: Callable, repeat: int) -> Dict[str, float]:
+    """Funkcja mierząca czas wykonania (repeat powtórzeń) i szczytowe zużycie pamięci.
+
+    Parameters:
+    func(Callable): bezargumentowa funkcja do zmierzenia
+    repeat(int): liczba powtórzeń pomiaru czasu
+
+    Results:
+    dict: najlepszy i średni czas [s], odchylenie standardowe i szczytowa pamięć [B]
+    """
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        gc.collect()
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {'time': min(times),
+            'time_mean': statistics.mean(times),
+            'time_stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+            'peak_memory': peak}
+
+
+def run(repeat: int = 5, quick: bool = False, pattern: str = None,
+        selection: Dict[str, List[str]] = None) -> dict:
+    """Funkcja uruchamiająca wszystkie (lub wybrane) przypadki testowe.
+
+    Parameters:
+    repeat(int): liczba powtórzeń pomiaru czasu
+    quick(bool): czy ograniczyć przegląd do najmniejszego rozmiaru
+    pattern(str): fragment nazwy 'labN.funkcja' wybierający przypadki
+    selection(Dict[str, List[str]]): przypadki i rozmiary do zmierzenia, np. zapisane w pliku odniesienia
+
+    Results:
+    dict: wyniki w postaci {'meta': ..., 'results': {'labN.funkcja': {rozmiar: pomiar}}}
+    """
+    results = {}
+    for lab, name, sizes, setup in CASES:
+        key = '{}.{}'.format(lab, name)
+        if pattern is not None and pattern not in key:
+            continue
+        if selection is not None:
+            if key not in selection:
+                continue
+            sizes = [size for size in sizes if str(size) in selection[key]]
+        if quick:
+            sizes = sizes[:1]
+        if not sizes:
+            continue
+        main = load_lab(lab)
+        results[key] = {}
+        for size in sizes:
+            result = measure(setup(main, size), repeat)
+            results[key][str(size)] = result
+            print('{:<32} {:>10} {:>12.3e} s {:>12.1f} KiB'.format(
+                key, size, result['time'], result['peak_memory'] / 1024))
+    meta = {'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat}
+    return {'meta': meta, 'results': results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> List[str]:
+    """Funkcja porównująca dwa zestawy wyników i zwracająca listę regresji,
+    tzn. pomiarów, których czas lub pamięć wzrosły o więcej niż threshold (względnie).
+
+    Parameters:
+    baseline(dict): wyniki odniesienia
+    current(dict): wyniki bieżące
+    threshold(float): dopuszczalny względny wzrost, np. 0.1 = 10%
+
+    Results:
+    List[str]: opisy wykrytych regresji
+    """
+    regressions = []
+    for key, sizes in current['results'].items():
+        for size, result in sizes.items():
+            ref = baseline['results'].get(key, {}).get(size)
+            if ref is None:
+                continue
+            for metric in ('time', 'peak_memory'):
+                if ref[metric] <= 0:
+                    continue
+                ratio = result[metric] / ref[metric]
+                flag = 'REGRESSION' if ratio > 1 + threshold else ''
+                print('{:<32} {:>10} {:<12} {:>8.2f}x {}'.format(key, size, metric, ratio, flag))
+                if flag:
+                    regressions.append('{} [{}] {}: {:.2f}x'.format(key, size, metric, ratio))
+    return regressions
+
+
+def _main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    run_parser = sub.add_parser('run', help='uruchomienie testów i zapis wyników')
+    run_parser.add_argument('-o', '--output', help='plik JSON z wynikami')
+    run_parser.add_argument('-r', '--repeat', type=int, default=5)
+    run_parser.add_argument('--quick', action='store_true', help='tylko najmniejszy rozmiar problemu')
+    run_parser.add_argument('--filter', dest='pattern', help='np. lab8 albo barycentric')
+    cmp_parser = sub.add_parser('compare', help='porównanie wyników z plikiem odniesienia')
+    cmp_parser.add_argument('baseline', help='plik JSON z wynikami odniesienia')
+    cmp_parser.add_argument('current', nargs='?', help='plik JSON z wynikami bieżącymi (domyślnie nowy pomiar)')
+    cmp_parser.add_argument('-t', '--threshold', type=float, default=0.1)
+    cmp_parser.add_argument('-r', '--repeat', type=int, default=5)
+    cmp_parser.add_argument('--quick', action='store_true', help='tylko najmniejszy rozmiar problemu')
+    cmp_parser.add_argument('--filter', dest='pattern', help='np. lab8 albo barycentric')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.repeat, args.quick, args.pattern)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        # nowy pomiar tylko dla przypadków i rozmiarów zapisanych w pliku odniesienia
+        selection = {key: list(sizes) for key, sizes in baseline['results'].items()}
+        current = run(args.repeat, args.quick, args.pattern, selection)
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(_main())
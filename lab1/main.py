@@ -1,6 +1,10 @@
 import math
 import numpy as np
 
+from typing import Union
+
+FIB_INT64_MAX_N = 92
+
 def cylinder_area(r:float,h:float):
     """Obliczenie pola powierzchni walca. 
     Szczegółowy opis w zadaniu 1.
@@ -24,6 +28,10 @@ def fib(n:int):
     """Obliczenie pierwszych n wyrazów ciągu Fibonnaciego. 
     Szczegółowy opis w zadaniu 3.
     
+    Wektor wyników jest alokowany jednorazowo. Dla n <= 92 wynik ma stałą precyzję
+    (np.int64). Dla większych n wyrazy nie mieszczą się w int64, dlatego zwracany jest
+    wektor o typie object zawierający liczby całkowite Pythona (dowolna precyzja).
+    
     Parameters:
     n (int): liczba określająca ilość wyrazów ciągu do obliczenia 
     
@@ -33,33 +41,105 @@ def fib(n:int):
     if isinstance(n, int) is True:
         if n <= 0:
             return None
-        else:        
-            if n == 1:
-                return [1]
-            fib_vector = np.array([1, 1])
-            for n in range(2, n):
-                fib_vector = np.append(fib_vector, fib_vector[n - 1] + fib_vector[n - 2])
+        else:
+            dtype = np.int64 if n <= FIB_INT64_MAX_N else object
+            fib_vector = np.empty(n, dtype=dtype)
+            for i, value in enumerate(fib_stream(n)):
+                fib_vector[i] = value
             return fib_vector
     else:
         return None
 
-def matrix_calculations(a:float):
+def fib_stream(n:int=None):
+    """Generator kolejnych wyrazów ciągu Fibonnaciego (1, 1, 2, 3, ...).
+    Wyrazy są liczbami całkowitymi Pythona (dowolna precyzja) i są wyznaczane
+    leniwie, więc generator może działać na nieograniczonym strumieniu.
+    
+    Parameters:
+    n (int): liczba wyrazów do wygenerowania, None oznacza strumień nieskończony
+    
+    Returns:
+    Generator[int]: kolejne wyrazy ciągu Fibonnaciego.
+    """
+    a, b = 1, 1
+    i = 0
+    while n is None or i < n:
+        yield a
+        a, b = b, a + b
+        i += 1
+
+def fib_nth(n:int):
+    """Obliczenie n-tego wyrazu ciągu Fibonnaciego (fib_nth(1) = fib_nth(2) = 1)
+    metodą szybkiego podwajania, wykorzystującą O(log n) mnożeń:
+    F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2.
+    
+    Parameters:
+    n (int): numer wyrazu ciągu
+    
+    Returns:
+    int: n-ty wyraz ciągu jako liczba całkowita Pythona (dowolna precyzja).
+         Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    """
+    if isinstance(n, int) is True:
+        if n <= 0:
+            return None
+        a, b = 0, 1
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if bit == '1':
+                a, b = d, c + d
+            else:
+                a, b = c, d
+        return a
+    else:
+        return None
+
+def matrix_calculations(a:Union[float, np.ndarray]):
     """Funkcja zwraca wartości obliczeń na macierzy stworzonej 
     na podstawie parametru a.  
     Szczegółowy opis w zadaniu 4.
     
+    Dla wektora parametrów a (N,) obliczenia wykonywane są jednocześnie dla wszystkich
+    macierzy za pomocą wzorów jawnych (macierz dołączona i iloczyny wektorowe wierszy),
+    bez wywołań ogólnych procedur LAPACK. Macierze osobliwe (wyznacznik równy 0)
+    otrzymują odwrotność wypełnioną wartościami NaN.
+    
     Parameters:
-    a (float): wartość liczbowa 
+    a (Union[float, np.ndarray]): wartość liczbowa lub wektor wartości (N,)
     
     Returns:
     touple: krotka zawierająca wyniki obliczeń 
     (Minv, Mt, Mdet) - opis parametrów w zadaniu 4.
+    Dla wektora a: Minv (N,3,3), Mt (N,3,3), Mdet (N,)
     """
-    M = np.array([[a,1,-a],[0,1,1],[-a,a,1]])
-    if a == 0:
-        return np.NaN, np.transpose(M), np.linalg.det(M)
-    else:
-        return np.linalg.inv(M), np.transpose(M), np.linalg.det(M)
+    a_arr = np.asarray(a, dtype=float)
+    scalar = a_arr.ndim == 0
+    a_arr = np.atleast_1d(a_arr)
+    M = np.empty(a_arr.shape + (3, 3))
+    M[..., 0, 0] = a_arr
+    M[..., 0, 1] = 1
+    M[..., 0, 2] = -a_arr
+    M[..., 1, 0] = 0
+    M[..., 1, 1] = 1
+    M[..., 1, 2] = 1
+    M[..., 2, 0] = -a_arr
+    M[..., 2, 1] = a_arr
+    M[..., 2, 2] = 1
+    r0, r1, r2 = M[..., 0, :], M[..., 1, :], M[..., 2, :]
+    # kolumny macierzy dołączonej to iloczyny wektorowe wierszy
+    adj = np.stack((np.cross(r1, r2), np.cross(r2, r0), np.cross(r0, r1)), axis=-1)
+    Mdet = np.einsum('...i,...i->...', r0, adj[..., :, 0])
+    singular = Mdet == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Minv = adj / Mdet[..., np.newaxis, np.newaxis]
+    Minv[singular] = np.nan
+    Mt = np.swapaxes(M, -1, -2)
+    if scalar:
+        if singular[0]:
+            return np.NaN, Mt[0], Mdet[0]
+        return Minv[0], Mt[0], Mdet[0]
+    return Minv, Mt, Mdet
 
         
 
@@ -76,15 +156,83 @@ def custom_matrix(m:int, n:int):
     """
     if isinstance(m, int) is True and isinstance(n, int) is True:
         if m > 0 and n > 0:
-            M = np.zeros((m, n))
-            for i in range(0, m):
-                for j in range(0, n):
-                    if i > j:
-                        M[i][j] = i
-                    else:
-                        M[i][j] = j
-            return M
+            return np.maximum.outer(np.arange(m), np.arange(n)).astype(float)
         else:
             return None
     else:
-        return None
\ No newline at end of file
+        return None
+
+class CustomMatrix:
+    """Niejawna (niematerializowana) postać macierzy z zadania 7, M[i, j] = max(i, j).
+    Przechowywane są jedynie indeksy wierszy i kolumn, więc pamięć wynosi O(m+n).
+    Mnożenie przez wektor lub blok wektorów wykorzystuje sumy prefiksowe:
+    (Mx)_i = r_i * sum_{c_j <= r_i} x_j + sum_{c_j > r_i} c_j * x_j.
+    
+    Parameters:
+    m (int): ilość wierszy macierzy
+    n (int): ilość kolumn macierzy
+    """
+
+    # wymusza użycie __rmatmul__ dla wyrażeń np.ndarray @ CustomMatrix
+    __array_ufunc__ = None
+
+    def __init__(self, m:int, n:int):
+        if not isinstance(m, int) or not isinstance(n, int) or m <= 0 or n <= 0:
+            raise ValueError('m i n muszą być dodatnimi liczbami całkowitymi')
+        self._rows = np.arange(m)
+        self._cols = np.arange(n)
+
+    @classmethod
+    def _from_indices(cls, rows:np.ndarray, cols:np.ndarray):
+        M = cls.__new__(cls)
+        M._rows = rows
+        M._cols = cols
+        return M
+
+    @property
+    def shape(self):
+        return self._rows.size, self._cols.size
+
+    @property
+    def T(self):
+        return CustomMatrix._from_indices(self._cols, self._rows)
+
+    def transpose(self):
+        return self.T
+
+    def to_dense(self) -> np.ndarray:
+        """Funkcja zwraca macierz w postaci gęstej tablicy (m,n)."""
+        return np.maximum.outer(self._rows, self._cols).astype(float)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        if len(key) != 2:
+            raise IndexError('macierz posiada dwa wymiary')
+        rows = self._rows[key[0]]
+        cols = self._cols[key[1]]
+        if np.ndim(rows) == 0 or np.ndim(cols) == 0:
+            return np.maximum(rows, cols).astype(float)
+        return CustomMatrix._from_indices(rows, cols)
+
+    def __matmul__(self, x):
+        x = np.asarray(x)
+        if x.ndim not in (1, 2) or x.shape[0] != self._cols.size:
+            raise ValueError('niezgodne wymiary: {} @ {}'.format(self.shape, x.shape))
+        cols = self._cols
+        if np.any(np.diff(cols) < 0):
+            order = np.argsort(cols, kind='stable')
+            cols = cols[order]
+            x = x[order]
+        weights = cols if x.ndim == 1 else cols[:, np.newaxis]
+        zero = np.zeros((1,) + x.shape[1:])
+        # S[k] = suma x_j, T[k] = suma c_j * x_j dla k najmniejszych indeksów kolumn
+        S = np.concatenate((zero, np.cumsum(x, axis=0)))
+        T = np.concatenate((zero, np.cumsum(weights * x, axis=0)))
+        k = np.searchsorted(cols, self._rows, side='right')
+        rows = self._rows if x.ndim == 1 else self._rows[:, np.newaxis]
+        return rows * S[k] + (T[-1] - T[k])
+
+    def __rmatmul__(self, x):
+        x = np.asarray(x)
+        return (self.T @ x.T).T
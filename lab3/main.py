@@ -20,7 +20,7 @@ def absolut_error(v: Union[int, float, List, np.ndarray], v_aprox: Union[int, fl
     if isinstance(v, (List, np.ndarray)) and isinstance(v_aprox, (List, np.ndarray)) and len(v) != len(v_aprox):
         return np.NaN
     
-    return abs(np.array(v) - np.array(v_aprox))
+    return abs(np.asarray(v) - np.asarray(v_aprox))
 
 
 def relative_error(v: Union[int, float, List, np.ndarray], v_aprox: Union[int, float, List, np.ndarray]) -> Union[int, float, np.ndarray]:
@@ -37,12 +37,122 @@ def relative_error(v: Union[int, float, List, np.ndarray], v_aprox: Union[int, f
     """
     if isinstance(v, (int, float, List, np.ndarray)) == False or isinstance(v_aprox, (int, float, List, np.ndarray)) == False:
         return np.NaN
-    if isinstance(v, (List, np.ndarray)) and isinstance(v_aprox, (List, np.ndarray)) and (len(v) != len(v_aprox) or 0 in v):
+    if isinstance(v, (List, np.ndarray)) and isinstance(v_aprox, (List, np.ndarray)) and len(v) != len(v_aprox):
+        return np.NaN
+    v = np.asarray(v)
+    if np.any(v == 0):
+        return np.NaN
+
+    return abs((v - np.asarray(v_aprox)) / v)
+
+
+class ErrorAccumulator:
+    """Strumieniowy akumulator błędów bezwzględnych i względnych.
+    Dane przekazywane są kolejnymi, wzajemnie odpowiadającymi sobie fragmentami
+    (np. z plików np.memmap), a akumulator przechowuje jedynie statystyki bieżące:
+    maksimum, średnią i wartość skuteczną (RMS) błędu bezwzględnego i względnego
+    oraz liczbę zerowych wartości dokładnych, dla których błąd względny jest pomijany.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.zero_count = 0
+        self._abs_max = 0.0
+        self._abs_sum = 0.0
+        self._abs_sq_sum = 0.0
+        self._rel_max = 0.0
+        self._rel_sum = 0.0
+        self._rel_sq_sum = 0.0
+
+    def update(self, v: Union[int, float, List, np.ndarray], v_aprox: Union[int, float, List, np.ndarray]) -> 'ErrorAccumulator':
+        """Funkcja uwzględniająca w statystykach kolejny fragment danych.
+        
+        Parameters:
+        v (Union[int, float, List, np.ndarray]): fragment wartości dokładnych
+        v_aprox (Union[int, float, List, np.ndarray]): odpowiadający fragment wartości przybliżonych
+        
+        Returns:
+        ErrorAccumulator: akumulator (umożliwia łączenie wywołań)
+        """
+        v = np.asarray(v, dtype=float).reshape(-1)
+        v_aprox = np.asarray(v_aprox, dtype=float).reshape(-1)
+        if v.shape != v_aprox.shape:
+            raise ValueError('fragmenty v i v_aprox muszą mieć ten sam rozmiar')
+        if v.size == 0:
+            return self
+        err = np.abs(v - v_aprox)
+        self.count += v.size
+        self._abs_max = max(self._abs_max, float(np.max(err)))
+        self._abs_sum += float(np.sum(err))
+        self._abs_sq_sum += float(np.dot(err, err))
+
+        nonzero = v != 0
+        self.zero_count += int(v.size - np.count_nonzero(nonzero))
+        rel = err[nonzero] / np.abs(v[nonzero])
+        if rel.size:
+            self._rel_max = max(self._rel_max, float(np.max(rel)))
+            self._rel_sum += float(np.sum(rel))
+            self._rel_sq_sum += float(np.dot(rel, rel))
+        return self
+
+    @property
+    def abs_max(self) -> float:
+        return self._abs_max if self.count else np.nan
+
+    @property
+    def abs_mean(self) -> float:
+        return self._abs_sum / self.count if self.count else np.nan
+
+    @property
+    def abs_rms(self) -> float:
+        return np.sqrt(self._abs_sq_sum / self.count) if self.count else np.nan
+
+    @property
+    def rel_max(self) -> float:
+        return self._rel_max if self.count > self.zero_count else np.nan
+
+    @property
+    def rel_mean(self) -> float:
+        n = self.count - self.zero_count
+        return self._rel_sum / n if n else np.nan
+
+    @property
+    def rel_rms(self) -> float:
+        n = self.count - self.zero_count
+        return np.sqrt(self._rel_sq_sum / n) if n else np.nan
+
+    def summary(self) -> dict:
+        """Funkcja zwracająca słownik z aktualnymi statystykami błędów."""
+        return {'count': self.count, 'zero_count': self.zero_count,
+                'abs_max': self.abs_max, 'abs_mean': self.abs_mean, 'abs_rms': self.abs_rms,
+                'rel_max': self.rel_max, 'rel_mean': self.rel_mean, 'rel_rms': self.rel_rms}
+
+
+def streaming_error(v: np.ndarray, v_aprox: np.ndarray, chunk_size: int = 2**20) -> ErrorAccumulator:
+    """Funkcja wyznaczająca statystyki błędów dla dużych tablic (np. np.memmap)
+    przetwarzając je fragmentami po chunk_size elementów, tak aby w pamięci nigdy
+    nie znajdowały się całe tablice.
+    
+    Parameters:
+    v (np.ndarray): wartości dokładne
+    v_aprox (np.ndarray): wartości przybliżone o tym samym rozmiarze co v
+    chunk_size (int): liczba elementów przetwarzanych jednocześnie
+    
+    Returns:
+    ErrorAccumulator: akumulator ze statystykami błędów,
+                      NaN w przypadku błędnych danych wejściowych
+    """
+    if isinstance(v, np.ndarray) == False or isinstance(v_aprox, np.ndarray) == False or v.size != v_aprox.size:
         return np.NaN
-    if isinstance(v, (int, float)) and v == 0:
+    if isinstance(chunk_size, int) == False or chunk_size <= 0:
         return np.NaN
 
-    return abs((np.array(v) - np.array(v_aprox)) / v)
+    v = v.reshape(-1)
+    v_aprox = v_aprox.reshape(-1)
+    acc = ErrorAccumulator()
+    for start in range(0, v.size, chunk_size):
+        acc.update(v[start:start + chunk_size], v_aprox[start:start + chunk_size])
+    return acc
 
 
 def p_diff(n: int, c: float) -> float:
@@ -69,7 +179,7 @@ def p_diff(n: int, c: float) -> float:
 
 def exponential(x: Union[int, float], n: int) -> float:
     """Funkcja znajdująca przybliżenie funkcji exp(x).
-    Do obliczania silni można użyć funkcji scipy.math.factorial(x)
+    Kolejne wyrazy szeregu wyznaczane są przyrostowo (term *= x / i), bez obliczania silni.
     Szczegóły w Zadaniu 3.
     
     Parameters:
@@ -83,10 +193,132 @@ def exponential(x: Union[int, float], n: int) -> float:
     if isinstance(n, int) == False or isinstance(x, (int, float)) == False or n <= 0:
         return np.NaN
     
-    exp_aprox = 0
-    for i in range(n):
-        exp_aprox += 1 / scipy.math.factorial(i) * (x**i)
-    return exp_aprox
+    return exponential_partial_sums(x, n)[-1, 0]
+
+
+def exponential_partial_sums(x: Union[int, float, List, np.ndarray], n: int) -> np.ndarray:
+    """Funkcja wyznaczająca wszystkie sumy częściowe szeregu Taylora funkcji exp(x)
+    o długości 1..n w jednym przebiegu, jednocześnie dla wektora argumentów.
+    Pozwala wyznaczyć zależność błędu od n jednym wywołaniem.
+    
+    Parameters:
+    x Union[int, float, List, np.ndarray]: wykładnik lub wektor wykładników (m,)
+    n Union[int]: maksymalna liczba wyrazów w ciągu
+    
+    Returns:
+    exp_aprox np.ndarray: tablica (n, m), wiersz i zawiera sumę i+1 pierwszych wyrazów,
+                          NaN w przypadku błędnych danych wejściowych
+    """
+    if isinstance(n, int) == False or isinstance(x, (int, float, List, np.ndarray)) == False or n <= 0:
+        return np.NaN
+
+    x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+    terms = np.empty((n, x.size))
+    terms[0] = 1
+    for i in range(1, n):
+        terms[i] = terms[i - 1] * x / i
+    return np.cumsum(terms, axis=0)
+
+
+def exponential_tol(x: Union[int, float, List, np.ndarray], rtol: float = 1e-15, maxiter: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja znajdująca przybliżenie funkcji exp(x) z zadaną dokładnością względną.
+    Sumowany jest szereg dla |x| (wszystkie wyrazy dodatnie, brak redukcji cyfr znaczących),
+    a dla x < 0 zwracana jest odwrotność exp(-x) = 1/exp(|x|).
+    Sumowanie kończy się niezależnie dla każdego elementu, gdy oszacowanie reszty szeregu
+    term * q / (1 - q), q = |x| / (i + 1) < 1, spełnia warunek <= rtol * suma.
+    Dalsze iteracje obejmują tylko elementy niezbieżne.
+    
+    Parameters:
+    x Union[int, float, List, np.ndarray]: wykładnik lub wektor wykładników (m,)
+    rtol float: zadana dokładność względna
+    maxiter int: maksymalna liczba wyrazów szeregu
+    
+    Returns:
+    exp_aprox np.ndarray: wektor (m,) przybliżeń funkcji exp(x)
+    n_terms np.ndarray: wektor (m,) liczby wyrazów użytych dla każdego elementu,
+                        NaN w przypadku błędnych danych wejściowych
+    """
+    if isinstance(x, (int, float, List, np.ndarray)) == False or isinstance(rtol, float) == False or isinstance(maxiter, int) == False or maxiter <= 0:
+        return np.NaN
+
+    x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+    x_abs = np.abs(x)
+    exp_aprox = np.ones(x.size)
+    n_terms = np.ones(x.size, dtype=int)
+    active = np.arange(x.size)
+    term = np.ones(x.size)
+    for i in range(1, maxiter):
+        if active.size == 0:
+            break
+        term = term * x_abs[active] / i
+        exp_aprox[active] += term
+        n_terms[active] = i + 1
+        # reszta szeregu jest ograniczona przez szereg geometryczny o ilorazie q
+        q = x_abs[active] / (i + 1)
+        running = (q >= 1) | (term * q > rtol * (1 - q) * exp_aprox[active])
+        active = active[running]
+        term = term[running]
+    negative = x < 0
+    exp_aprox[negative] = 1 / exp_aprox[negative]
+    return exp_aprox, n_terms
+
+
+def coskx1_table(k: int, x: Union[int, float, List, np.ndarray]) -> np.ndarray:
+    """Funkcja wyznaczająca tablicę wartości cos(jx) dla j = 0..k. Metoda 1.
+    Wartości obliczane są iteracyjnie z zależności rekurencyjnej
+    cos(jx) = 2cos(x)cos((j-1)x) - cos((j-2)x) jednocześnie dla wszystkich x, w czasie O(k).
+    Szczegóły w Zadaniu 4.
+    
+    Parameters:
+    x Union[int, float, List, np.ndarray]: argument lub wektor argumentów (n,)
+    k Union[int]: 
+    
+    Returns:
+    coskx np.ndarray: tablica (k+1, n) przybliżeń cos(jx),
+                      NaN w przypadku błędnych danych wejściowych
+    """
+    if isinstance(k, int) == False or isinstance(x, (int, float, List, np.ndarray)) == False or k < 0:
+        return np.NaN
+
+    x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+    coskx = np.empty((k + 1, x.size))
+    coskx[0] = 1
+    if k >= 1:
+        coskx[1] = np.cos(x)
+    for j in range(2, k + 1):
+        coskx[j] = 2 * coskx[1] * coskx[j - 1] - coskx[j - 2]
+    return coskx
+
+
+def coskx2_table(k: int, x: Union[int, float, List, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja wyznaczająca tablice wartości cos(jx) i sin(jx) dla j = 0..k. Metoda 2.
+    Wartości obliczane są iteracyjnie ze wzorów na cosinus i sinus sumy kątów
+    jednocześnie dla wszystkich x, w czasie O(k).
+    Szczegóły w Zadaniu 4.
+    
+    Parameters:
+    x Union[int, float, List, np.ndarray]: argument lub wektor argumentów (n,)
+    k Union[int]: 
+    
+    Returns:
+    coskx, sinkx np.ndarray: tablice (k+1, n) przybliżeń cos(jx) i sin(jx),
+                             NaN w przypadku błędnych danych wejściowych
+    """
+    if isinstance(k, int) == False or isinstance(x, (int, float, List, np.ndarray)) == False or k < 0:
+        return np.NaN
+
+    x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+    coskx = np.empty((k + 1, x.size))
+    sinkx = np.empty((k + 1, x.size))
+    coskx[0] = 1
+    sinkx[0] = 0
+    if k >= 1:
+        coskx[1] = np.cos(x)
+        sinkx[1] = np.sin(x)
+    for j in range(2, k + 1):
+        coskx[j] = coskx[1] * coskx[j - 1] - sinkx[1] * sinkx[j - 1]
+        sinkx[j] = sinkx[1] * coskx[j - 1] + coskx[1] * sinkx[j - 1]
+    return coskx, sinkx
 
 
 def coskx1(k: int, x: Union[int, float]) -> float:
@@ -104,10 +336,7 @@ def coskx1(k: int, x: Union[int, float]) -> float:
     if isinstance(k, int) == False or isinstance(x, (int, float)) == False or k < 0:
         return np.NaN
 
-    if k == 1 or k == 0:
-        return np.cos(k * x)
-    coskx = 2 * np.cos(x) * coskx1(k - 1, x) - coskx1(k - 2, x)
-    return coskx
+    return coskx1_table(k, x)[-1, 0]
     
 
 def coskx2(k: int, x: Union[int, float]) -> Tuple[float, float]:
@@ -125,34 +354,49 @@ def coskx2(k: int, x: Union[int, float]) -> Tuple[float, float]:
     if isinstance(k, int) == False or isinstance(x, (int, float)) == False or k < 0:
         return np.NaN
 
-    def cos2(j: int, x: Union[int, float]) -> float:
-        if j == 1 or j == 0:
-            return np.cos(j * x)
-        return np.cos(x) * cos2(j - 1, x) - np.sin(x) * sin2(j - 1, x)
-
-    def sin2(j: int, x: Union[int, float]) -> float:
-        if j == 1 or j == 0:
-            return np.sin(j * x)
-        return np.sin(x) * cos2(j - 1, x) + np.cos(x) * sin2(j - 1, x)
+    coskx, sinkx = coskx2_table(k, x)
+    return coskx[-1, 0], sinkx[-1, 0]
 
-    return cos2(k, x), sin2(k, x)
 
-
-def pi(n: int) -> float:
+def pi(n: int, accelerated: bool = False) -> float:
     """Funkcja znajdująca przybliżenie wartości stałej pi.
     Szczegóły w Zadaniu 5.
     
     Parameters:
     n Union[int, List[int], np.ndarray[int]]: liczba wyrazów w ciągu
+    accelerated bool: czy uwzględnić poprawkę Eulera-Maclaurina dla pominiętej reszty szeregu
     
     Returns:
     pi_aprox float: przybliżenie stałej pi,
                     NaN w przypadku błędnych danych wejściowych
     """
-    if isinstance(n, int) == False or n == 0:
+    if isinstance(n, int) == False or n <= 0:
         return np.NaN
     
-    pi_aprox = 0
-    for i in range(1, n + 1):
-        pi_aprox += 1 / i**2
-    return np.sqrt(6 * pi_aprox)
\ No newline at end of file
+    return pi_curve(n, accelerated)[-1]
+
+
+def pi_curve(N: int, accelerated: bool = False) -> np.ndarray:
+    """Funkcja wyznaczająca przybliżenia stałej pi dla n = 1..N w jednym przebiegu,
+    na podstawie sumy skumulowanej szeregu 1/i^2 (koszt O(N) zamiast O(N^2)).
+    Opcjonalnie do każdej sumy częściowej dodawana jest poprawka Eulera-Maclaurina
+    reszty szeregu sum_{i>n} 1/i^2 ~ 1/n - 1/(2n^2) + 1/(6n^3) - 1/(30n^5) + 1/(42n^7),
+    dzięki której dokładność maszynową osiąga się już dla kilkudziesięciu wyrazów.
+    Szczegóły w Zadaniu 5.
+    
+    Parameters:
+    N int: maksymalna liczba wyrazów w ciągu
+    accelerated bool: czy uwzględnić poprawkę Eulera-Maclaurina
+    
+    Returns:
+    pi_aprox np.ndarray: wektor (N,) przybliżeń stałej pi dla n = 1..N,
+                         NaN w przypadku błędnych danych wejściowych
+    """
+    if isinstance(N, int) == False or N <= 0:
+        return np.NaN
+
+    n = np.arange(1, N + 1, dtype=float)
+    partial = np.cumsum(1 / n**2)
+    if accelerated:
+        partial += 1 / n - 1 / (2 * n**2) + 1 / (6 * n**3) - 1 / (30 * n**5) + 1 / (42 * n**7)
+    return np.sqrt(6 * partial)
\ No newline at end of file
@@ -3,7 +3,30 @@ import numpy as np
 import scipy
 import matplotlib.pyplot as plt
 
-from typing import Union, List, Tuple
+from functools import lru_cache
+
+from typing import Union, List, Tuple, Callable
+
+@lru_cache(maxsize=128)
+def _chebyshev_nodes_weights(n:int)-> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja wyznaczająca węzły Czebyszewa i odpowiadające im wagi barycentryczne
+    dla zadanego n. Wyniki są przechowywane w ograniczonym buforze LRU i współdzielone
+    pomiędzy wywołaniami, dlatego zwracane tablice są tylko do odczytu.
+    
+    Parameters:
+    n(int): numer ostaniego węzła Czebyszewa. Wartość musi być większa od 0.
+     
+    Results:
+    (np.ndarray, np.ndarray): wektor węzłów (n+1,) i wektor wag (n+1,) tylko do odczytu
+    """
+    k = np.arange(n + 1)
+    nodes = np.cos(k * np.pi / n)
+    weights = np.where(k % 2 == 0, 1.0, -1.0)
+    weights[0] = weights[0] / 2
+    weights[-1] = weights[-1] / 2
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
 
 def chebyshev_nodes(n:int=10)-> np.ndarray:
     """Funkcja tworząca wektor zawierający węzły czybyszewa w postaci wektora (n+1,)
@@ -18,10 +41,7 @@ def chebyshev_nodes(n:int=10)-> np.ndarray:
     if not isinstance(n, int) or n <= 0:
         return None
     
-    result = []
-    for k in range(n + 1):
-        result.append(np.cos(k * np.pi / n))
-    return np.array(result) 
+    return _chebyshev_nodes_weights(n)[0].copy()
     
 def bar_czeb_weights(n:int=10)-> np.ndarray:
     """Funkcja tworząca wektor wag dla węzłów czybyszewa w postaci (n+1,)
@@ -36,42 +56,103 @@ def bar_czeb_weights(n:int=10)-> np.ndarray:
     if not isinstance(n, int) or n <= 0:
         return None
     
-    result = []
-    for j in range(n + 1):
-        if j == 0 or j == n:
-            delta = 1 / 2
-        else:
-            delta = 1
-        w = (-1) ** j * delta
-        result.append(w)
-    return np.array(result)
+    return _chebyshev_nodes_weights(n)[1].copy()
     
-def  barycentric_inte(xi:np.ndarray,yi:np.ndarray,wi:np.ndarray,x:np.ndarray)-> np.ndarray:
+def  barycentric_inte(xi:np.ndarray,yi:np.ndarray,wi:np.ndarray,x:np.ndarray,chunk_size:int=4096)-> np.ndarray:
     """Funkcja przprowadza interpolację metodą barycentryczną dla zadanych węzłów xi
         i wartości funkcji interpolowanej yi używając wag wi. Zwraca wyliczone wartości
         funkcji interpolującej dla argumentów x w postaci wektora (n,) gdzie n to dłógość
         wektora n. 
+
+        Obliczenia wykonywane są wektorowo dla bloków po chunk_size argumentów
+        (macierz (chunk_size, m)), co ogranicza zużycie pamięci. Argumenty pokrywające się
+        z węzłami zwracają dokładnie wartość yi w danym węźle. Jeżeli yi ma postać
+        macierzy (m,k), każda kolumna interpolowana jest w tym samym przebiegu.
     
     Parameters:
     xi(np.ndarray): węzły interpolacji w postaci wektora (m,), gdzie m > 0
-    yi(np.ndarray): wartości funkcji interpolowanej w węzłach w postaci wektora (m,), gdzie m>0
+    yi(np.ndarray): wartości funkcji interpolowanej w węzłach w postaci wektora (m,) lub macierzy (m,k), gdzie m>0
     wi(np.ndarray): wagi interpolacji w postaci wektora (m,), gdzie m>0
     x(np.ndarray): argumenty dla funkcji interpolującej (n,), gdzie n>0 
+    chunk_size(int): liczba argumentów przetwarzanych w jednym bloku, chunk_size > 0
      
     Results:
-    np.ndarray: wektor wartości funkcji interpolujący o rozmiarze (n,). 
+    np.ndarray: wektor wartości funkcji interpolujący o rozmiarze (n,) lub macierz (n,k) dla yi (m,k). 
                 Jeżeli dane wejściowe niepoprawne funkcja zwraca None
     """
     if not isinstance(xi, np.ndarray) or not isinstance(yi, np.ndarray) or not isinstance(wi, np.ndarray) or not isinstance(x, np.ndarray):
         return None
-    elif np.shape(xi) == np.shape(yi) and np.shape(yi) == np.shape(wi):
-        result = []
-        for value in np.nditer(x):
-            L = wi / (value - xi)
-            result.append(yi @ L / sum(L))
-        return np.array(result)
-    else:
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
         return None
+    if xi.ndim != 1 or np.shape(xi) != np.shape(wi) or yi.ndim not in (1, 2) or yi.shape[0] != xi.shape[0]:
+        return None
+
+    x_flat = np.ravel(x)
+    result = np.empty((x_flat.size,) + yi.shape[1:], dtype=np.result_type(xi, yi, wi, x, float))
+    for start in range(0, x_flat.size, chunk_size):
+        stop = min(start + chunk_size, x_flat.size)
+        diff = x_flat[start:stop, np.newaxis] - xi
+        rows, cols = np.nonzero(diff == 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            L = wi / diff
+        # argument równy węzłowi: cała waga na ten węzeł
+        L[rows] = 0
+        L[rows, cols] = 1
+        denominator = np.sum(L, axis=1)
+        if yi.ndim == 2:
+            denominator = denominator[:, np.newaxis]
+        result[start:stop] = (L @ yi) / denominator
+    return result.reshape(np.shape(x) + yi.shape[1:])
+
+class BarycentricInterpolant:
+    """Interpolant barycentryczny przechowujący węzły, wartości i wyznaczone raz wagi.
+    Obiekt można wywoływać jak funkcję dla skalarów i tablic argumentów.
+    
+    Parameters:
+    xi(np.ndarray): węzły interpolacji w postaci wektora (m,), gdzie m > 0
+    yi(np.ndarray): wartości funkcji interpolowanej w węzłach (m,) lub (m,k)
+    wi(np.ndarray): wagi interpolacji (m,). Jeżeli None, wagi wyznaczane są dla dowolnych
+                    (różnych) węzłów ze wzoru w_j = 1 / prod_{k != j}(x_j - x_k)
+    chunk_size(int): liczba argumentów przetwarzanych w jednym bloku
+    """
+
+    def __init__(self, xi:np.ndarray, yi:np.ndarray, wi:np.ndarray=None, chunk_size:int=4096):
+        xi = np.asarray(xi, dtype=float)
+        yi = np.asarray(yi)
+        if xi.ndim != 1 or xi.size == 0 or yi.ndim not in (1, 2) or yi.shape[0] != xi.size:
+            raise ValueError('xi musi mieć postać (m,), a yi (m,) lub (m,k)')
+        if wi is None:
+            diff = xi[:, np.newaxis] - xi
+            np.fill_diagonal(diff, 1)
+            wi = 1 / np.prod(diff, axis=1)
+        wi = np.asarray(wi, dtype=float)
+        if wi.shape != xi.shape:
+            raise ValueError('wi musi mieć ten sam rozmiar co xi')
+        self.xi = xi
+        self.yi = yi
+        self.wi = wi
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def from_function(cls, f:Callable, n:int, chunk_size:int=4096) -> 'BarycentricInterpolant':
+        """Funkcja tworząca interpolant funkcji f na n+1 węzłach Czebyszewa.
+        Węzły i wagi pobierane są ze wspólnego bufora LRU.
+        
+        Parameters:
+        f(Callable): funkcja interpolowana, wywoływana na wektorze węzłów
+        n(int): numer ostaniego węzła Czebyszewa. Wartość musi być większa od 0.
+        
+        Results:
+        BarycentricInterpolant: interpolant funkcji f
+        """
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError('n musi być dodatnią liczbą całkowitą')
+        xi, wi = _chebyshev_nodes_weights(n)
+        return cls(xi, f(xi), wi, chunk_size)
+
+    def __call__(self, x:Union[int, float, List, np.ndarray]) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        return barycentric_inte(self.xi, self.yi, self.wi, x, self.chunk_size)
 
 def L_inf(xr:Union[int, float, List, np.ndarray],x:Union[int, float, List, np.ndarray])-> float:
     """Obliczenie normy  L nieskończonośćg. 
@@ -1,8 +1,35 @@
 import numpy as np
 import scipy
+import importlib.util
+import os
 import pickle
+import sys
+import scipy.sparse
+from scipy import linalg
 
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Callable
+
+
+def _load_lab(lab: str):
+    """Funkcja importująca moduł ../labN/main.py pod unikalną nazwą labN_main
+    (wszystkie moduły laboratoriów nazywają się main)."""
+    name = '{}_main'.format(lab)
+    if name not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, lab, 'main.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# węzły Czebyszewa (ze wspólnym buforem LRU) i interpolacja barycentryczna są wspólne z lab4
+_lab4 = _load_lab('lab4')
+_chebyshev_nodes_weights = _lab4._chebyshev_nodes_weights
+chebyshev_nodes = _lab4.chebyshev_nodes
+bar_czeb_weights = _lab4.bar_czeb_weights
+barycentric_inte = _lab4.barycentric_inte
+BarycentricInterpolant = _lab4.BarycentricInterpolant
 
 
 def first_spline(x: np.ndarray, y: np.ndarray):
@@ -26,19 +53,33 @@ def first_spline(x: np.ndarray, y: np.ndarray):
             
 
 
-def cubic_spline(x, y, tol = 1e-100):
+def cubic_spline(x, y, bc_type: str = 'natural', d_bounds: Tuple[float, float] = (0.0, 0.0)):
     """
-    Interpolate using natural cubic splines.
+    Interpolate using cubic splines.
+    
+    The tridiagonal system for c is stored in banded form and solved directly
+    with LAPACK (scipy.linalg.solve_banded) in O(n) time and memory.
     
-    Generates a strictly diagonal dominant matrix then applies Jacobi's method.
+    Parameters:
+    x, y: knots and function values
+    bc_type: boundary condition:
+        - 'natural' -> S''(x_0) = S''(x_n) = 0
+        - 'clamped' -> S'(x_0) = d_bounds[0], S'(x_n) = d_bounds[1]
+        - 'not-a-knot' -> continuous third derivative at x_1 and x_(n-1) (requires at least 4 knots)
+    d_bounds: first derivative values at both ends, used by 'clamped'
     
     Returns coefficients:
     b, coefficient of x of degree 1
     c, coefficient of x of degree 2
     d, coefficient of x of degree 3
+    None if input data is invalid
     """ 
-    x = np.array(x)
-    y = np.array(y)
+    x = np.array(x, dtype=float)
+    y = np.array(y, dtype=float)
+    if x.ndim != 1 or x.shape != y.shape or len(x) < 2:
+        return None
+    if bc_type not in ('natural', 'clamped', 'not-a-knot') or (bc_type == 'not-a-knot' and len(x) < 4):
+        return None
     ### check if sorted
     if np.any(np.diff(x) < 0):
         idx = np.argsort(x)
@@ -48,120 +89,379 @@ def cubic_spline(x, y, tol = 1e-100):
     size = len(x)
     delta_x = np.diff(x)
     delta_y = np.diff(y)
+    slope = delta_y / delta_x
     
-    ### Get matrix A
-    A = np.zeros(shape = (size,size))
-    b = np.zeros(shape=(size,1))
-    A[0,0] = 1
-    A[-1,-1] = 1
-    
-    for i in range(1,size-1):
-        A[i, i-1] = delta_x[i-1]
-        A[i, i+1] = delta_x[i]
-        A[i,i] = 2*(delta_x[i-1]+delta_x[i])
-    ### Get matrix b
-        b[i,0] = 3*(delta_y[i]/delta_x[i] - delta_y[i-1]/delta_x[i-1])
-        
+    ### Banded matrix A (2 sub- and 2 superdiagonals, A[i, j] = ab[2 + i - j, j]) and vector b
+    ab = np.zeros(shape=(5, size))
+    b = np.zeros(shape=size)
+    ab[2, 1:-1] = 2 * (delta_x[:-1] + delta_x[1:])
+    ab[3, :-2] = delta_x[:-1]
+    ab[1, 2:] = delta_x[1:]
+    b[1:-1] = 3 * (slope[1:] - slope[:-1])
+
+    if bc_type == 'natural':
+        ab[2, 0] = 1
+        ab[2, -1] = 1
+    elif bc_type == 'clamped':
+        ab[2, 0] = 2 * delta_x[0]
+        ab[1, 1] = delta_x[0]
+        b[0] = 3 * (slope[0] - d_bounds[0])
+        ab[2, -1] = 2 * delta_x[-1]
+        ab[3, -2] = delta_x[-1]
+        b[-1] = 3 * (d_bounds[1] - slope[-1])
+    else:
+        ### d_0 = d_1 and d_(n-2) = d_(n-1)
+        ab[2, 0] = delta_x[1]
+        ab[1, 1] = -(delta_x[0] + delta_x[1])
+        ab[0, 2] = delta_x[0]
+        ab[2, -1] = delta_x[-2]
+        ab[3, -2] = -(delta_x[-2] + delta_x[-1])
+        ab[4, -3] = delta_x[-1]
+
     ### Solves for c in Ac = b
-    print('Jacobi Method Output:')
-    c = jacobi(A, b, np.zeros(len(A)), tol = tol, n_iterations=1000)
+    if bc_type == 'not-a-knot':
+        c = linalg.solve_banded((2, 2), ab, b)
+    else:
+        c = linalg.solve_banded((1, 1), ab[1:4], b)
     
     ### Solves for d and b
-    d = np.zeros(shape = (size-1,1))
-    b = np.zeros(shape = (size-1,1))
-    for i in range(0,len(d)):
-        d[i] = (c[i+1] - c[i]) / (3*delta_x[i])
-        b[i] = (delta_y[i]/delta_x[i]) - (delta_x[i]/3)*(2*c[i] + c[i+1])    
+    d = (c[1:] - c[:-1]) / (3 * delta_x)
+    b = slope - (delta_x / 3) * (2 * c[:-1] + c[1:])
+    
+    return b, c, d
+
+class Spline:
+    """Funkcja sklejana przechowująca węzły i współczynniki wielomianów na przedziałach.
+    Na przedziale [x_i, x_(i+1)] wartość wynosi sum_k coefs[k, i] * (x - x_i)^k.
+    Wyznaczanie wartości odbywa się dla całych wektorów argumentów: przedziały
+    wyszukiwane są funkcją np.searchsorted, a wielomiany liczone schematem Hornera.
+    
+    Parameters:
+    x(np.ndarray): rosnący wektor węzłów (n+1,)
+    coefs(np.ndarray): współczynniki (stopień+1, n) w bazie lokalnej, od wyrazu wolnego
+    """
+
+    def __init__(self, x: np.ndarray, coefs: np.ndarray):
+        x = np.asarray(x, dtype=float)
+        coefs = np.asarray(coefs, dtype=float)
+        if x.ndim != 1 or coefs.ndim != 2 or coefs.shape[1] != x.size - 1 or x.size < 2:
+            raise ValueError('coefs musi mieć rozmiar (stopień+1, len(x)-1)')
+        if np.any(np.diff(x) <= 0):
+            raise ValueError('węzły muszą być ściśle rosnące')
+        self.x = x
+        self.coefs = coefs
+
+    @classmethod
+    def linear(cls, x: np.ndarray, y: np.ndarray) -> 'Spline':
+        """Funkcja sklejana pierwszego stopnia (first_spline)."""
+        result = first_spline(x, y)
+        if result is None:
+            raise ValueError('niepoprawne dane wejściowe')
+        a, _ = result
+        return cls(x, np.vstack((y[:-1], a)))
+
+    @classmethod
+    def cubic(cls, x: np.ndarray, y: np.ndarray, bc_type: str = 'natural',
+              d_bounds: Tuple[float, float] = (0.0, 0.0)) -> 'Spline':
+        """Funkcja sklejana trzeciego stopnia (cubic_spline)."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        idx = np.argsort(x, kind='stable')
+        result = cubic_spline(x, y, bc_type, d_bounds)
+        if result is None:
+            raise ValueError('niepoprawne dane wejściowe')
+        b, c, d = result
+        return cls(x[idx], np.vstack((y[idx][:-1], b, c[:-1], d)))
+
+    @property
+    def degree(self) -> int:
+        return self.coefs.shape[0] - 1
+
+    @classmethod
+    def _view(cls, x: np.ndarray, coefs: np.ndarray) -> 'Spline':
+        """Konstruktor bez kopiowania i sprawdzania danych (dla widoków na bufory StreamingSpline)."""
+        spline = cls.__new__(cls)
+        spline.x = x
+        spline.coefs = coefs
+        return spline
+
+    @staticmethod
+    def _derivative_coefs(coefs: np.ndarray, nu: int) -> np.ndarray:
+        for _ in range(nu):
+            if coefs.shape[0] == 1:
+                return np.zeros_like(coefs)
+            k = np.arange(1, coefs.shape[0]).reshape((-1,) + (1,) * (coefs.ndim - 1))
+            coefs = coefs[1:] * k
+        return coefs
+
+    def _horner(self, idx: np.ndarray, x: np.ndarray, nu: int = 0) -> np.ndarray:
+        # współczynniki (i ich pochodne) wybierane są tylko dla przedziałów argumentów
+        coefs = self._derivative_coefs(self.coefs[:, idx], nu)
+        t = x - self.x[idx]
+        result = coefs[-1]
+        for k in range(coefs.shape[0] - 2, -1, -1):
+            result = result * t + coefs[k]
+        return result
+
+    def _sorted_interval(self, x: np.ndarray, start: int = 0) -> np.ndarray:
+        """Numery przedziałów dla posortowanego, niepustego wektora x, przy założeniu x[0] >= self.x[start].
+        Przeszukiwane są tylko węzły z zakresu [x[0], x[-1]]: jeżeli jest ich mniej niż argumentów,
+        węzły wyszukiwane są w x (scalanie), w przeciwnym razie argumenty w węzłach z tego zakresu,
+        więc koszt nie zależy od liczby wszystkich węzłów.
+        """
+        base = start + np.searchsorted(self.x[start:], x[0], side='right') - 1
+        top = base + 1 + np.searchsorted(self.x[base + 1:], x[-1], side='right')
+        knots = self.x[base + 1:top]
+        if knots.size < x.size:
+            # liczba węzłów z zakresu <= x dla każdego argumentu
+            bounds = np.searchsorted(x, knots, side='left')
+            idx = base + np.cumsum(np.bincount(bounds, minlength=x.size + 1))[:x.size]
+        else:
+            idx = base + np.searchsorted(knots, x, side='right')
+        return np.clip(idx, 0, self.x.size - 2)
+
+    def interval(self, x: np.ndarray, assume_sorted: bool = False) -> np.ndarray:
+        """Funkcja zwracająca numery przedziałów dla argumentów x (poza zakresem: skrajne przedziały).
+        Dla posortowanych argumentów przeszukiwany jest tylko zakres węzłów [x[0], x[-1]].
+        """
+        x = np.asarray(x, dtype=float)
+        n = self.x.size - 1
+        if assume_sorted and x.ndim == 1 and x.size > 0:
+            return self._sorted_interval(x)
+        idx = np.searchsorted(self.x, x, side='right') - 1
+        return np.clip(idx, 0, n - 1)
+
+    def __call__(self, x: Union[int, float, List, np.ndarray], nu: int = 0, assume_sorted: bool = False) -> np.ndarray:
+        """Funkcja wyznaczająca wartości (lub nu-tą pochodną) funkcji sklejanej.
+        
+        Parameters:
+        x(Union[int, float, List, np.ndarray]): argumenty
+        nu(int): rząd pochodnej, nu >= 0
+        assume_sorted(bool): czy argumenty są posortowane rosnąco
+        
+        Results:
+        np.ndarray: wartości o rozmiarze takim jak x
+        """
+        if not isinstance(nu, int) or nu < 0:
+            raise ValueError('nu musi być nieujemną liczbą całkowitą')
+        x = np.asarray(x, dtype=float)
+        idx = self.interval(x, assume_sorted)
+        return self._horner(idx, x, nu)
+
+    def antiderivative(self) -> 'Spline':
+        """Funkcja pierwotna (ciągła, równa 0 w x_0) jako funkcja sklejana stopnia o 1 wyższego."""
+        k = np.arange(1, self.coefs.shape[0] + 1)[:, np.newaxis]
+        coefs = np.vstack((np.zeros(self.coefs.shape[1]), self.coefs / k))
+        h = np.diff(self.x)
+        segment = np.sum(coefs * h ** np.arange(coefs.shape[0])[:, np.newaxis], axis=0)
+        coefs[0, 1:] = np.cumsum(segment)[:-1]
+        return Spline(self.x, coefs)
+
+    def integrate(self, a: float, b: float) -> float:
+        """Całka oznaczona funkcji sklejanej na przedziale [a, b]."""
+        F = self.antiderivative()
+        return float(F(b) - F(a))
+
+    def evaluate_stream(self, chunks, nu: int = 0):
+        """Generator wartości dla strumienia rosnących fragmentów argumentów.
+        Pozycja w wektorze węzłów (kursor) jest przesuwana tylko do przodu, a każdy
+        fragment przeszukuje wyłącznie węzły z zakresu od bieżącego przedziału do swojego
+        ostatniego argumentu, więc koszt zależy od rozmiaru fragmentu, a nie liczby węzłów.
+        
+        Parameters:
+        chunks(Iterable[np.ndarray]): kolejne posortowane fragmenty argumentów
+        nu(int): rząd pochodnej
+        
+        Results:
+        Generator[np.ndarray]: wartości dla kolejnych fragmentów
+        """
+        cursor = 0
+        last = -np.inf
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=float).ravel()
+            if chunk.size == 0:
+                yield chunk
+                continue
+            if chunk[0] < last or np.any(np.diff(chunk) < 0):
+                raise ValueError('fragmenty strumienia muszą być posortowane rosnąco')
+            last = chunk[-1]
+            idx = self._sorted_interval(chunk, cursor)
+            cursor = int(idx[-1])
+            yield self._horner(idx, chunk, nu)
+
+class StreamingSpline:
+    """Przyrostowa naturalna funkcja sklejana trzeciego stopnia dla danych dopisywanych na końcu.
+    Wpływ zmiany na końcu układu trójdiagonalnego maleje geometrycznie wraz z odległością,
+    dlatego po dopisaniu węzłów rozwiązywany jest jedynie układ dla ostatnich window
+    węzłów (z ustaloną wartością c na początku okna), a wcześniejsze współczynniki
+    pozostają zamrożone. Współczynniki y, b, c, d przechowywane są w jednym buforze (4, pojemność)
+    i po dopisaniu przeliczane tylko w oknie, więc wyznaczanie wartości nie kopiuje węzłów
+    ani nie przelicza współczynników. Najstarsze węzły mogą być usuwane (max_knots), dzięki czemu
+    zużycie pamięci jest ograniczone także dla nieskończonych strumieni.
     
-    return b.squeeze(), c.squeeze(), d.squeeze()
+    Parameters:
+    window(int): liczba ostatnich węzłów, dla których układ jest rozwiązywany ponownie
+    max_knots(int): maksymalna liczba przechowywanych węzłów (None - bez ograniczenia), max_knots > window
+    """
+
+    def __init__(self, window: int = 32, max_knots: int = None):
+        if not isinstance(window, int) or window < 2:
+            raise ValueError('window musi być liczbą całkowitą >= 2')
+        if max_knots is not None and (not isinstance(max_knots, int) or max_knots <= window):
+            raise ValueError('max_knots musi być liczbą całkowitą większą od window')
+        self.window = window
+        self.max_knots = max_knots
+        self._x = np.empty(0)
+        # wiersze: y, b, c, d; kolumna i odpowiada przedziałowi [x_i, x_(i+1)]
+        self._coefs = np.empty((4, 0))
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x[self._start:self._end]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._coefs[0, self._start:self._end]
+
+    @property
+    def c(self) -> np.ndarray:
+        return self._coefs[2, self._start:self._end]
+
+    def _reserve(self, k: int):
+        size = len(self)
+        if self._end + k <= self._x.size:
+            return
+        capacity = max(2 * (size + k), 16)
+        x = np.empty(capacity)
+        x[:size] = self.x
+        coefs = np.empty((4, capacity))
+        coefs[:, :size] = self._coefs[:, self._start:self._end]
+        self._x = x
+        self._coefs = coefs
+        self._start = 0
+        self._end = size
+
+    def append(self, x: Union[int, float, List, np.ndarray], y: Union[int, float, List, np.ndarray]) -> 'StreamingSpline':
+        """Funkcja dopisująca nowe węzły (rosnące, większe od ostatniego węzła) na końcu.
+        
+        Parameters:
+        x(Union[int, float, List, np.ndarray]): nowe węzły
+        y(Union[int, float, List, np.ndarray]): wartości w nowych węzłach
+        
+        Results:
+        StreamingSpline: obiekt (umożliwia łączenie wywołań)
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+        y = np.atleast_1d(np.asarray(y, dtype=float)).ravel()
+        if x.shape != y.shape:
+            raise ValueError('x i y muszą mieć ten sam rozmiar')
+        if x.size == 0:
+            return self
+        if np.any(np.diff(x) <= 0) or (len(self) and x[0] <= self._x[self._end - 1]):
+            raise ValueError('nowe węzły muszą być ściśle rosnące i większe od ostatniego węzła')
+        self._reserve(x.size)
+        new_end = self._end + x.size
+        self._x[self._end:new_end] = x
+        self._coefs[0, self._end:new_end] = y
+        self._coefs[2, self._end:new_end] = 0
+        self._end = new_end
+        self._solve_tail(x.size)
+        if self.max_knots is not None and len(self) > self.max_knots:
+            self._start = self._end - self.max_knots
+        return self
+
+    def _solve_tail(self, added: int):
+        n = len(self)
+        if n < 2:
+            return
+        # okno obejmuje nowe węzły i window poprzednich; c[k0] pozostaje zamrożone
+        k0 = max(0, n - 1 - added - self.window)
+        x = self.x[k0:]
+        y = self.y[k0:]
+        c = self.c[k0:]
+        h = np.diff(x)
+        slope = np.diff(y) / h
+        if n >= 3:
+            m = x.size - 2
+            ab = np.zeros((3, m))
+            ab[0, 1:] = h[1:-1]
+            ab[1] = 2 * (h[:-1] + h[1:])
+            ab[2, :-1] = h[1:-1]
+            rhs = 3 * (slope[1:] - slope[:-1])
+            rhs[0] -= h[0] * c[0]
+            c[1:-1] = linalg.solve_banded((1, 1), ab, rhs)
+            c[-1] = 0
+        # b i d zmieniają się tylko na przedziałach, których końce mają nowe c
+        lo, hi = self._start + k0, self._end - 1
+        self._coefs[1, lo:hi] = slope - (h / 3) * (2 * c[:-1] + c[1:])
+        self._coefs[3, lo:hi] = (c[1:] - c[:-1]) / (3 * h)
+
+    def _spline_view(self) -> Spline:
+        if len(self) < 2:
+            raise ValueError('funkcja sklejana wymaga co najmniej 2 węzłów')
+        return Spline._view(self.x, self._coefs[:, self._start:self._end - 1])
+
+    def to_spline(self) -> Spline:
+        """Funkcja zwracająca niezależną kopię (obiekt Spline) dla aktualnie przechowywanych węzłów."""
+        view = self._spline_view()
+        return Spline(view.x.copy(), view.coefs.copy())
+
+    def __call__(self, x: Union[int, float, List, np.ndarray], nu: int = 0) -> np.ndarray:
+        return self._spline_view()(x, nu)
 
 def jacobi(A, b, x0, tol, n_iterations=300):
     """
     Iteracyjne rozwiązanie równania Ax=b dla zadanego x0
 
+    Każda iteracja to jedno wektorowe przejście x_new = (b - (A x - D x)) / D
+    wykonywane w uprzednio zaalokowanych buforach. Macierz A może być gęsta
+    (np.ndarray) lub rzadka (scipy.sparse), wtedy koszt iteracji wynosi O(nnz).
+
     Returns:
     x - estymowane rozwiązanie
+    counter - liczba wykonanych iteracji
+    history - wektor (counter,) norm ||x_k - x_(k-1)|| w kolejnych iteracjach
+    None jeżeli dane wejściowe są niepoprawne
     """
+    if not isinstance(A, np.ndarray) and not scipy.sparse.issparse(A):
+        return None
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or np.size(b) != A.shape[0] or np.size(x0) != A.shape[0]:
+        return None
+    sparse = scipy.sparse.issparse(A)
+    if sparse:
+        A = scipy.sparse.csr_matrix(A)
     n = A.shape[0]
-    x = x0.copy()
-    x_prev = x0.copy()
+    diag = A.diagonal().astype(float)
+    b = np.asarray(b, dtype=float).reshape(n)
+
+    x = np.array(x0, dtype=float).reshape(n)
+    x_new = np.empty(n)
+    Ax = np.empty(n)
+    tmp = np.empty(n)
+    history = np.empty(n_iterations)
     counter = 0
     x_diff = tol + 1
 
     while (x_diff > tol) and (counter < n_iterations):
-        for i in range(0, n):
-            s = 0
-            for j in range(0, n):
-                if i != j:
-                    s += A[i, j] * x_prev[j]
-            x[i] = (b[i] - s) / A[i, i]
-        counter += 1
-        x_diff = (np.sum((x - x_prev) ** 2)) ** 0.5
-        x_prev = x.copy()
-    return x
-
-def chebyshev_nodes(n:int=10)-> np.ndarray:
-    """Funkcja tworząca wektor zawierający węzły czybyszewa w postaci wektora (n+1,)
-    
-    Parameters:
-    n(int): numer ostaniego węzła Czebyszewa. Wartość musi być większa od 0.
-     
-    Results:
-    np.ndarray: wektor węzłów Czybyszewa o rozmiarze (n+1,). 
-                Jeżeli dane wejściowe niepoprawne funkcja zwraca None
-    """
-    if not isinstance(n, int) or n <= 0:
-        return None
-    
-    result = []
-    for k in range(n + 1):
-        result.append(np.cos(k * np.pi / n))
-    return np.array(result) 
-    
-def bar_czeb_weights(n:int=10)-> np.ndarray:
-    """Funkcja tworząca wektor wag dla węzłów czybyszewa w postaci (n+1,)
-    
-    Parameters:
-    n(int): numer ostaniej wagi dla węzłów Czebyszewa. Wartość musi być większa od 0.
-     
-    Results:
-    np.ndarray: wektor wag dla węzłów Czybyszewa o rozmiarze (n+1,). 
-                Jeżeli dane wejściowe niepoprawne funkcja zwraca None
-    """
-    result = []
-    for j in range(n + 1):
-        if j == 0 or j == n:
-            delta = 1 / 2
+        if sparse:
+            Ax[:] = A @ x
         else:
-            delta = 1
-        w = (-1) ** j * delta
-        result.append(w)
-    return np.array(result)
-    
-def barycentric_inte(xi:np.ndarray,yi:np.ndarray,wi:np.ndarray,x:np.ndarray)-> np.ndarray:
-    """Funkcja przprowadza interpolację metodą barycentryczną dla zadanych węzłów xi
-        i wartości funkcji interpolowanej yi używając wag wi. Zwraca wyliczone wartości
-        funkcji interpolującej dla argumentów x w postaci wektora (n,) gdzie n to dłógość
-        wektora n. 
-    
-    Parameters:
-    xi(np.ndarray): węzły interpolacji w postaci wektora (m,), gdzie m > 0
-    yi(np.ndarray): wartości funkcji interpolowanej w węzłach w postaci wektora (m,), gdzie m>0
-    wi(np.ndarray): wagi interpolacji w postaci wektora (m,), gdzie m>0
-    x(np.ndarray): argumenty dla funkcji interpolującej (n,), gdzie n>0 
-     
-    Results:
-    np.ndarray: wektor wartości funkcji interpolujący o rozmiarze (n,). 
-                Jeżeli dane wejściowe niepoprawne funkcja zwraca None
-    """
-    result = []
-    for value in x:
-        if value in np.nditer(xi):
-            result.append(yi[np.where(xi==value)[0][0]])
-        else:
-            L = wi / (value - xi)
-            result.append(yi @ L / sum(L))
-    return np.array(result)
+            np.dot(A, x, out=Ax)
+        np.multiply(diag, x, out=tmp)
+        np.subtract(Ax, tmp, out=Ax)
+        np.subtract(b, Ax, out=x_new)
+        np.divide(x_new, diag, out=x_new)
+        np.subtract(x_new, x, out=tmp)
+        x_diff = np.linalg.norm(tmp)
+        history[counter] = x_diff
+        counter += 1
+        x, x_new = x_new, x
+    return x.reshape(np.shape(x0)), counter, history[:counter]
 
 def L_inf(xr:Union[int, float, List, np.ndarray],x:Union[int, float, List, np.ndarray])-> float:
     """Obliczenie normy  L nieskończonośćg. 
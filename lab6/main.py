@@ -1,12 +1,53 @@
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 import pickle
+from scipy import linalg
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, List, Tuple
 
-def random_matrix_Ab(m:int):
+def _seed_sequences(seed, k: int) -> List[np.random.SeedSequence]:
+    """Funkcja tworząca k niezależnych ciągów ziaren (np.random.SeedSequence.spawn) z ziarna seed
+    (int, np.random.SeedSequence albo None - losowe ziarno)."""
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return seed_seq.spawn(k)
+
+
+def _random_integers(shape: Tuple[int, int], low: int, high: int, seed_seq: np.random.SeedSequence,
+                     workers: int = 1, block_rows: int = 1024) -> np.ndarray:
+    """Funkcja generująca macierz (m,n) losowych liczb całkowitych z przedziału [low, high).
+    Wiersze wypełniane są blokami po block_rows, a każdy blok ma własny generator utworzony
+    przez seed_seq.spawn, dlatego wynik zależy tylko od ziarna, a nie od liczby wątków
+    (workers) ani kolejności ich wykonania.
+    """
+    m, n = shape
+    starts = range(0, m, block_rows)
+    children = seed_seq.spawn(len(starts))
+    A = np.empty((m, n), dtype=np.int64)
+
+    def fill(k: int):
+        start = starts[k]
+        stop = min(start + block_rows, m)
+        A[start:stop] = np.random.default_rng(children[k]).integers(low, high, size=(stop - start, n))
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fill, range(len(starts))))
+    else:
+        for k in range(len(starts)):
+            fill(k)
+    return A
+
+
+def random_matrix_Ab(m:int, seed=None, workers:int=1):
     """Funkcja tworząca zestaw składający się z macierzy A (m,m) i wektora b (m,)  zawierających losowe wartości
+    Wartości losowane są generatorem np.random.Generator o jawnym ziarnie (wynik powtarzalny
+    niezależnie od liczby wątków).
     Parameters:
     m(int): rozmiar macierzy
+    seed: ziarno generatora (int, np.random.SeedSequence albo None)
+    workers(int): liczba wątków generujących macierz
     Results:
     (np.ndarray, np.ndarray): macierz o rozmiarze (m,m) i wektorem (m,)
                 Jeżeli dane wejściowe niepoprawne funkcja zwraca None
@@ -14,28 +55,49 @@ def random_matrix_Ab(m:int):
     if not isinstance(m, int) or m <= 0:
         return None
     else:
-        A = np.random.randint(0, 100, size=(m, m))
-        b = np.random.randint(0, 100, size=(m,))
+        seq_A, seq_b = _seed_sequences(seed, 2)
+        A = _random_integers((m, m), 0, 100, seq_A, workers)
+        b = np.random.default_rng(seq_b).integers(0, 100, size=(m,))
     return A, b
 
-def residual_norm(A:np.ndarray,x:np.ndarray, b:np.ndarray):
+def residual_norm(A, x: np.ndarray, b: np.ndarray, block_size: int = 4096):
     """Funkcja obliczająca normę residuum dla równania postaci:
     Ax = b
 
+      Macierz A może być gęsta (również np.memmap), rzadka (scipy.sparse) lub być operatorem
+      liniowym (scipy.sparse.linalg.LinearOperator). Dla macierzy gęstych residuum liczone jest
+      blokami po block_size wierszy, więc nigdy nie jest materializowane w całości, a macierz
+      zapisana w pliku jest wczytywana fragmentami. Dla wielu prawych stron (x (n,k), b (m,k))
+      zwracany jest wektor norm residuum dla każdej kolumny.
+
       Parameters:
-      A: macierz A (m,m) zawierająca współczynniki równania 
-      x: wektor x (m.) zawierający rozwiązania równania 
-      b: wektor b (m,) zawierający współczynniki po prawej stronie równania
+      A: macierz A (m,n) zawierająca współczynniki równania
+      x: wektor x (n,) lub macierz (n,k) zawierające rozwiązania równania
+      b: wektor b (m,) lub macierz (m,k) zawierające współczynniki po prawej stronie równania
+      block_size: liczba wierszy macierzy A przetwarzanych jednocześnie
 
       Results:
-      (float)- wartość normy residuom dla podanych parametrów"""
-    if not isinstance(A, np.ndarray) or not isinstance(x, np.ndarray) or not isinstance(b, np.ndarray):
+      (float)- wartość normy residuom dla podanych parametrów,
+      (np.ndarray) - wektor (k,) norm dla wielu prawych stron
+      None jeżeli dane wejściowe są niepoprawne
+      """
+    if not isinstance(A, (np.ndarray, scipy.sparse.linalg.LinearOperator)) and not scipy.sparse.issparse(A):
         return None
-    if x.shape != b.shape or min(A.shape) != max(x.shape):
+    if not isinstance(x, np.ndarray) or not isinstance(b, np.ndarray) or not isinstance(block_size, int) or block_size <= 0:
         return None
-    r = b - A@x
-    return np.linalg.norm(r)
-
+    if len(A.shape) != 2 or x.ndim not in (1, 2) or x.ndim != b.ndim:
+        return None
+    if A.shape[1] != x.shape[0] or A.shape[0] != b.shape[0] or x.shape[1:] != b.shape[1:]:
+        return None
+    if not isinstance(A, np.ndarray):
+        r = b - A @ x
+        return np.linalg.norm(r, axis=0)
+    norm = np.zeros(x.shape[1:])
+    for start in range(0, A.shape[0], block_size):
+        stop = start + block_size
+        r = b[start:stop] - A[start:stop] @ x
+        norm = np.hypot(norm, np.linalg.norm(r, axis=0))
+    return norm[()]
 
 def log_sing_value(n:int, min_order:Union[int,float], max_order:Union[int,float]):
     """Funkcja generująca wektor wartości singularnych rozłożonych w skali logarytmiczne
@@ -54,7 +116,7 @@ def log_sing_value(n:int, min_order:Union[int,float], max_order:Union[int,float]
     else:
         return np.logspace(min_order, max_order, n)
     
-def order_sing_value(n:int, order:Union[int,float] = 2, site:str = 'gre'):
+def order_sing_value(n:int, order:Union[int,float] = 2, site:str = 'gre', seed=None):
     """Funkcja generująca wektor losowych wartości singularnych (n,) będących wartościami zmiennoprzecinkowymi losowanymi przy użyciu funkcji np.random.rand(n)*10. 
         A następnie ustawiająca wartość minimalną (site = 'low') albo maksymalną (site = 'gre') na wartość o  10**order razy mniejszą/większą.
     
@@ -64,6 +126,7 @@ def order_sing_value(n:int, order:Union[int,float] = 2, site:str = 'gre'):
         site(str): zmienna wskazująca stronnę zmiany:
             - site = 'low' -> sing_value[-1] * 10**order
             - site = 'gre' -> sing_value[0] * 10**order
+        seed: ziarno generatora np.random.Generator (int, np.random.SeedSequence albo None)
         
         Results:
         np.ndarray - wektor wartości singularnych o wymiarze (n,) zawierający wartości logarytmiczne na zadanym przedziale
@@ -73,7 +136,7 @@ def order_sing_value(n:int, order:Union[int,float] = 2, site:str = 'gre'):
     elif n <= 0:
         return None
     else:
-        sing_value = np.flip(np.sort(np.random.rand(n) * 10))
+        sing_value = np.flip(np.sort(np.random.default_rng(seed).random(n) * 10))
         if site == 'low':
             sing_value[-1] = sing_value[-1] * 10 ** order
         elif site == 'gre':
@@ -83,18 +146,180 @@ def order_sing_value(n:int, order:Union[int,float] = 2, site:str = 'gre'):
         return sing_value
 
 
-def create_matrix_from_A(A:np.ndarray, sing_value:np.ndarray):
+def create_matrix_from_A(A:np.ndarray, sing_value:np.ndarray, k:int=None, oversampling:int=10,
+                         power_iter:int=2, block_size:int=1024, seed:int=None):
     """Funkcja generująca rozkład SVD dla macierzy A i zwracająca otworzenie macierzy A z wykorzystaniem zdefiniowanego wektora warości singularnych
 
+    Funkcja przyjmuje również stos macierzy (B,m,m), dla którego rozkład SVD wykonywany jest jednym
+    wywołaniem np.linalg.svd. Dla k != None używany jest losowy, obcięty rozkład SVD rzędu k
+    (metoda Halko-Martinssona-Troppa), a wynik jest macierzą rzędu k zbudowaną z k największych
+    wartości singularnych. Iloczyn U*diag(s)*V^T wyznaczany jest blokami wierszy bezpośrednio
+    do tablicy wynikowej, bez dodatkowych pełnowymiarowych tablic pośrednich.
+
             Parameters:
-            A(np.ndarray): rozmiarz macierzy A (m,m)
-            sing_value(np.ndarray): wektor wartości singularnych (m,)
+            A(np.ndarray): rozmiarz macierzy A (m,m) lub stos macierzy (B,m,m)
+            sing_value(np.ndarray): wektor wartości singularnych (m,) lub (B,m); dla k != None wystarczy (k,)
+            k(int): rząd obciętego rozkładu SVD (None - pełny rozkład)
+            oversampling(int): liczba dodatkowych wektorów losowych w metodzie losowej
+            power_iter(int): liczba iteracji potęgowych w metodzie losowej
+            block_size(int): liczba wierszy wyniku liczonych w jednym bloku
+            seed(int): ziarno generatora liczb losowych dla metody losowej
 
 
             Results:
-            np.ndarray: macierz (m,m) utworzoną na podstawie rozkładu SVD zadanej macierzy A z podmienionym wektorem wartości singularnych na wektor sing_valu """
-    if not isinstance(A, np.ndarray) or not isinstance(sing_value, np.ndarray) or min(A.shape) != max(sing_value.shape):
+            np.ndarray: macierz (m,m) (lub (B,m,m)) utworzoną na podstawie rozkładu SVD zadanej macierzy A z podmienionym wektorem wartości singularnych na wektor sing_valu 
+                Jeżeli dane wejściowe niepoprawne funkcja zwraca None"""
+    if not isinstance(A, np.ndarray) or not isinstance(sing_value, np.ndarray):
         return None
-    else:
+    if A.ndim not in (2, 3) or sing_value.ndim not in (1, A.ndim - 1):
+        return None
+    if k is not None:
+        if not isinstance(k, int) or k <= 0 or k > min(A.shape[-2:]) or sing_value.shape[-1] < k:
+            return None
+    elif min(A.shape[-2:]) != sing_value.shape[-1]:
+        return None
+    if sing_value.ndim == 2 and sing_value.shape[0] != A.shape[0]:
+        return None
+
+    A = A.astype(float, copy=False)
+    if k is None:
         U, S, V = np.linalg.svd(A)
-        return np.dot(U * sing_value, V)
\ No newline at end of file
+        s = sing_value
+    else:
+        U, V = _randomized_svd(A, k, oversampling, power_iter, np.random.default_rng(seed))
+        s = sing_value[..., :k]
+    # skalowanie kolumn U w miejscu (U jest tablicą roboczą)
+    U *= s[..., np.newaxis, :]
+    result = np.empty(A.shape)
+    for start in range(0, A.shape[-2], block_size):
+        stop = start + block_size
+        np.matmul(U[..., start:stop, :], V, out=result[..., start:stop, :])
+    return result
+
+
+def _randomized_svd(A:np.ndarray, k:int, oversampling:int, power_iter:int, rng:np.random.Generator):
+    """Funkcja wyznaczająca losowy, obcięty rozkład SVD rzędu k macierzy (m,n) lub stosu (B,m,n).
+
+    Results:
+    (np.ndarray, np.ndarray): macierze U (...,m,k) i V^T (...,k,n)
+    """
+    n = A.shape[-1]
+    p = min(k + oversampling, min(A.shape[-2:]))
+    At = np.swapaxes(A, -1, -2)
+    Q, _ = np.linalg.qr(A @ rng.standard_normal((n, p)))
+    for _ in range(power_iter):
+        Q, _ = np.linalg.qr(At @ Q)
+        Q, _ = np.linalg.qr(A @ Q)
+    Ub, _, V = np.linalg.svd(np.swapaxes(Q, -1, -2) @ A, full_matrices=False)
+    return Q @ Ub[..., :k], V[..., :k, :]
+
+
+def solve_lu(A:np.ndarray, b:np.ndarray, estimate_cond:bool=False):
+    """Funkcja rozwiązująca układ Ax = b rozkładem LU i opcjonalnie zwracająca oszacowanie
+    współczynnika uwarunkowania w normie 1, wyznaczone z tego samego rozkładu (koszt O(n^2)).
+
+        Parameters:
+        A(np.ndarray): macierz (m,m)
+        b(np.ndarray): wektor (m,) lub macierz (m,k) prawych stron
+        estimate_cond(bool): czy oszacować współczynnik uwarunkowania
+
+        Results:
+        np.ndarray: rozwiązanie x, a dla estimate_cond=True krotka (x, cond_1)
+                Jeżeli dane wejściowe niepoprawne funkcja zwraca None"""
+    if not isinstance(A, np.ndarray) or not isinstance(b, np.ndarray) or A.ndim != 2 or A.shape[0] != A.shape[1] or b.shape[0] != A.shape[0]:
+        return None
+    lu_piv = linalg.lu_factor(A)
+    x = linalg.lu_solve(lu_piv, b)
+    if estimate_cond:
+        return x, cond_estimate(A, lu_piv)
+    return x
+
+
+def inv_norm1_estimate(lu_piv:Tuple[np.ndarray, np.ndarray], maxiter:int=5) -> float:
+    """Funkcja szacująca ||A^-1||_1 algorytmem Hagera z modyfikacjami Highama (jak LAPACK xLACON)
+    na podstawie istniejącego rozkładu LU. Każda iteracja to dwa rozwiązania układów trójkątnych.
+
+        Parameters:
+        lu_piv(Tuple[np.ndarray, np.ndarray]): rozkład LU zwrócony przez scipy.linalg.lu_factor
+        maxiter(int): maksymalna liczba iteracji
+
+        Results:
+        float: dolne oszacowanie normy ||A^-1||_1"""
+    n = lu_piv[0].shape[0]
+    x = np.full(n, 1 / n)
+    estimate = 0.0
+    j_prev = -1
+    for _ in range(maxiter):
+        y = linalg.lu_solve(lu_piv, x)
+        estimate = np.sum(np.abs(y))
+        xi = np.where(y >= 0, 1.0, -1.0)
+        z = linalg.lu_solve(lu_piv, xi, trans=1)
+        j = int(np.argmax(np.abs(z)))
+        if np.abs(z[j]) <= z @ x or j == j_prev:
+            break
+        x = np.zeros(n)
+        x[j] = 1
+        j_prev = j
+    # dodatkowy wektor testowy Highama chroniący przed niedoszacowaniem
+    if n > 1:
+        alt = (-1) ** np.arange(n) * (1 + np.arange(n) / (n - 1))
+        estimate = max(estimate, 2 * np.sum(np.abs(linalg.lu_solve(lu_piv, alt))) / (3 * n))
+    return estimate
+
+
+def cond_estimate(A:np.ndarray, lu_piv:Tuple[np.ndarray, np.ndarray]=None) -> float:
+    """Funkcja szacująca współczynnik uwarunkowania cond_1(A) = ||A||_1 * ||A^-1||_1 w O(n^2),
+    wykorzystując istniejący rozkład LU (jeżeli nie zostanie podany, jest wyznaczany).
+
+        Parameters:
+        A(np.ndarray): macierz (m,m)
+        lu_piv(Tuple[np.ndarray, np.ndarray]): rozkład LU zwrócony przez scipy.linalg.lu_factor
+
+        Results:
+        float: oszacowanie współczynnika uwarunkowania w normie 1
+                Jeżeli dane wejściowe niepoprawne funkcja zwraca None"""
+    if not isinstance(A, np.ndarray) or A.ndim != 2 or A.shape[0] != A.shape[1]:
+        return None
+    if lu_piv is None:
+        lu_piv = linalg.lu_factor(A)
+    return np.linalg.norm(A, 1) * inv_norm1_estimate(lu_piv)
+
+
+def sing_value_extremes(A:np.ndarray, lu_piv:Tuple[np.ndarray, np.ndarray]=None, maxiter:int=50,
+                        tol:float=1e-6, seed:int=None) -> Tuple[float, float]:
+    """Funkcja szacująca największą i najmniejszą wartość singularną macierzy kwadratowej metodą
+    potęgową dla A^T A oraz odwrotną metodą potęgową (z wykorzystaniem rozkładu LU).
+    Iloraz wyników jest oszacowaniem współczynnika uwarunkowania w normie 2.
+
+        Parameters:
+        A(np.ndarray): macierz (m,m)
+        lu_piv(Tuple[np.ndarray, np.ndarray]): rozkład LU zwrócony przez scipy.linalg.lu_factor
+        maxiter(int): maksymalna liczba iteracji każdej metody
+        tol(float): względna zmiana oszacowania kończąca iteracje
+        seed(int): ziarno generatora wektora startowego
+
+        Results:
+        (float, float): oszacowania (sigma_max, sigma_min)
+                Jeżeli dane wejściowe niepoprawne funkcja zwraca None"""
+    if not isinstance(A, np.ndarray) or A.ndim != 2 or A.shape[0] != A.shape[1]:
+        return None
+    if lu_piv is None:
+        lu_piv = linalg.lu_factor(A)
+    rng = np.random.default_rng(seed)
+    start = rng.standard_normal(A.shape[0])
+
+    def power(apply):
+        x = start / np.linalg.norm(start)
+        sigma = 0.0
+        for _ in range(maxiter):
+            y = apply(x)
+            sigma_new = np.sqrt(np.linalg.norm(y))
+            x = y / np.linalg.norm(y)
+            if abs(sigma_new - sigma) <= tol * sigma_new:
+                return sigma_new
+            sigma = sigma_new
+        return sigma
+
+    sigma_max = power(lambda x: A.T @ (A @ x))
+    sigma_min = 1 / power(lambda x: linalg.lu_solve(lu_piv, linalg.lu_solve(lu_piv, x, trans=1)))
+    return sigma_max, sigma_min
\ No newline at end of file
@@ -1,17 +1,40 @@
 import numpy as np
 import scipy as sp
+import scipy.sparse
+import scipy.sparse.linalg
 from scipy import linalg
 from  datetime import datetime
+import importlib.util
+import os
 import pickle
+import sys
 
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Iterable
 
 
-def spare_matrix_Abt(m: int,n: int):
+def _load_lab(lab: str):
+    """Funkcja importująca moduł ../labN/main.py pod unikalną nazwą labN_main
+    (wszystkie moduły laboratoriów nazywają się main)."""
+    name = '{}_main'.format(lab)
+    if name not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, lab, 'main.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# norma residuum jest wspólna z lab6
+residual_norm = _load_lab('lab6').residual_norm
+
+
+def spare_matrix_Abt(m: int,n: int, structured: bool = False):
     """Funkcja tworząca zestaw składający się z macierzy A (m,n), wektora b (m,)  i pomocniczego wektora t (m,) zawierających losowe wartości
     Parameters:
     m(int): ilość wierszy macierzy A
     n(int): ilość kolumn macierzy A
+    structured(bool): czy zwrócić macierz A jako operator VandermondeMatrix zamiast tablicy gęstej
     Results:
     (np.ndarray, np.ndarray): macierz o rozmiarze (m,n) i wektorem (m,)
                 Jeżeli dane wejściowe niepoprawne funkcja zwraca None
@@ -21,10 +44,141 @@ def spare_matrix_Abt(m: int,n: int):
     else:
       t = np.linspace(0, 1, m)
       b = np.cos(4 * t)
+      if structured:
+        return VandermondeMatrix(t, n), b
       A = np.fliplr(np.vander(t, n))
       return A, b  
 
 
+class VandermondeMatrix:
+    """Operator macierzy Vandermonde'a A[i, j] = t_i^j (m,n) przechowujący jedynie węzły t.
+    Iloczyn A @ c to wartości wielomianu o współczynnikach c w węzłach t (schemat Hornera, O(mn)),
+    układ kwadratowy rozwiązywany jest algorytmem Björcka-Pereyry w O(n^2), a zadanie najmniejszych
+    kwadratów - za pomocą wielomianów ortogonalnych na zbiorze węzłów (rekurencja Forsythe'a, O(mn)).
+    Parameters:
+    t(np.ndarray): wektor węzłów (m,)
+    n(int): ilość kolumn macierzy (stopień wielomianu + 1)
+    """
+
+    # wymusza użycie __rmatmul__ dla wyrażeń np.ndarray @ VandermondeMatrix
+    __array_ufunc__ = None
+
+    def __init__(self, t: np.ndarray, n: int):
+      t = np.asarray(t, dtype=float)
+      if t.ndim != 1 or t.size == 0 or not isinstance(n, int) or n <= 0:
+        raise ValueError('t musi być niepustym wektorem, a n dodatnią liczbą całkowitą')
+      self.t = t
+      self.n = n
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+      return self.t.size, self.n
+
+    @property
+    def dtype(self):
+      return self.t.dtype
+
+    def to_dense(self) -> np.ndarray:
+      """Funkcja zwraca macierz w postaci gęstej tablicy (m,n)."""
+      return np.fliplr(np.vander(self.t, self.n))
+
+    def matvec(self, c: np.ndarray) -> np.ndarray:
+      """Iloczyn A @ c dla wektora (n,) lub macierzy (n,k) - schemat Hornera."""
+      c = np.asarray(c)
+      if c.shape[0] != self.n or c.ndim not in (1, 2):
+        raise ValueError('niezgodne wymiary: {} @ {}'.format(self.shape, c.shape))
+      t = self.t if c.ndim == 1 else self.t[:, np.newaxis]
+      result = np.broadcast_to(c[-1], (self.t.size,) + c.shape[1:]).astype(float)
+      for j in range(self.n - 2, -1, -1):
+        result *= t
+        result += c[j]
+      return result
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+      """Iloczyn A^T @ y dla wektora (m,) lub macierzy (m,k): (A^T y)_j = sum_i t_i^j y_i."""
+      y = np.asarray(y, dtype=float)
+      if y.shape[0] != self.t.size or y.ndim not in (1, 2):
+        raise ValueError('niezgodne wymiary: {}^T @ {}'.format(self.shape, y.shape))
+      t = self.t if y.ndim == 1 else self.t[:, np.newaxis]
+      result = np.empty((self.n,) + y.shape[1:])
+      p = y.copy()
+      for j in range(self.n):
+        result[j] = np.sum(p, axis=0)
+        p *= t
+      return result
+
+    def __matmul__(self, c):
+      return self.matvec(c)
+
+    def __rmatmul__(self, y):
+      return self.rmatvec(np.asarray(y).T).T
+
+    def aslinearoperator(self) -> 'sp.sparse.linalg.LinearOperator':
+      """Funkcja zwraca operator jako scipy.sparse.linalg.LinearOperator."""
+      return scipy.sparse.linalg.LinearOperator(self.shape, matvec=self.matvec, rmatvec=self.rmatvec,
+                                                matmat=self.matvec, rmatmat=self.rmatvec, dtype=float)
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+      """Rozwiązanie układu kwadratowego A c = b (interpolacja wielomianowa) algorytmem
+      Björcka-Pereyry w O(n^2) operacjach. Węzły muszą być parami różne.
+      Parameters:
+        b: wektor (n,) lub macierz (n,k) prawych stron
+      Results:
+      np.ndarray: współczynniki c (n,) lub (n,k)
+      """
+      if self.t.size != self.n:
+        raise ValueError('algorytm Björcka-Pereyry wymaga macierzy kwadratowej')
+      c = np.array(b, dtype=float)
+      if c.shape[0] != self.n or c.ndim not in (1, 2):
+        raise ValueError('niezgodne wymiary: {} \\ {}'.format(self.shape, c.shape))
+      t = self.t if c.ndim == 1 else self.t[:, np.newaxis]
+      n = self.n - 1
+      # ilorazy różnicowe Newtona
+      for k in range(n):
+        c[k + 1:] = (c[k + 1:] - c[k:-1]) / (t[k + 1:] - t[:n - k])
+      # przejście od bazy Newtona do bazy potęgowej
+      for k in range(n - 1, -1, -1):
+        c[k:n] -= c[k + 1:n + 1] * t[k]
+      return c
+
+    def lstsq(self, b: np.ndarray) -> np.ndarray:
+      """Rozwiązanie zadania najmniejszych kwadratów min ||A c - b|| za pomocą wielomianów
+      ortogonalnych na zbiorze węzłów (rekurencja trójczłonowa Forsythe'a) w O(mn + n^2)
+      operacjach i O(m) dodatkowej pamięci, bez tworzenia macierzy A.
+      Parameters:
+        b: wektor (m,) lub macierz (m,k) prawych stron
+      Results:
+      np.ndarray: współczynniki c (n,) lub (n,k) w bazie potęgowej
+      """
+      r = np.array(b, dtype=float)
+      if r.shape[0] != self.t.size or r.ndim not in (1, 2):
+        raise ValueError('niezgodne wymiary: {} \\ {}'.format(self.shape, r.shape))
+      t = self.t
+      n = min(self.n, np.unique(t).size)
+      p_prev = np.zeros_like(t)
+      p = np.ones_like(t)
+      # współczynniki wielomianów p_j w bazie potęgowej
+      P_prev = np.zeros(self.n)
+      P = np.zeros(self.n)
+      P[0] = 1
+      c = np.zeros((self.n,) + r.shape[1:])
+      norm_prev = 1.0
+      for j in range(n):
+        norm = p @ p
+        d = (p @ r) / norm
+        r -= np.multiply.outer(p, d) if r.ndim == 2 else p * d
+        c += np.multiply.outer(P, d) if r.ndim == 2 else P * d
+        if j == n - 1:
+          break
+        alpha = (t * p) @ p / norm
+        beta = norm / norm_prev if j > 0 else 0.0
+        p_prev, p = p, (t - alpha) * p - beta * p_prev
+        P_next = np.roll(P, 1) - alpha * P - beta * P_prev
+        P_prev, P = P, P_next
+        norm_prev = norm
+      return c
+
+
 def square_from_rectan(A: np.ndarray, b: np.ndarray):
     """Funkcja przekształcająca układ równań z prostokątną macierzą współczynników na kwadratowy układ równań. Funkcja ma zwrócić nową macierz współczynników  i nowy wektor współczynników
     Parameters:
@@ -41,20 +195,42 @@ def square_from_rectan(A: np.ndarray, b: np.ndarray):
 
 
 
-def residual_norm(A: np.ndarray, x: np.ndarray, b: np.ndarray):
-    """Funkcja obliczająca normę residuum dla równania postaci:
-    Ax = b
-
-      Parameters:
-      A: macierz A (m,n) zawierająca współczynniki równania
-      x: wektor x (n,) zawierający rozwiązania równania
-      b: wektor b (m,) zawierający współczynniki po prawej stronie równania
+def lstsq_qr(A: Union[np.ndarray, Iterable[Tuple[np.ndarray, np.ndarray]]], b: np.ndarray = None, chunk_size: int = 4096):
+    """Funkcja rozwiązująca liniowe zadanie najmniejszych kwadratów min ||Ax - b|| przyrostowym
+    rozkładem QR (odbicia Householdera, LAPACK) bez tworzenia układu normalnego A^T A x = A^T b,
+    który podnosi do kwadratu współczynnik uwarunkowania. Wiersze A i b przetwarzane są
+    fragmentami: każdy fragment dołączany jest do trójkątnego czynnika R macierzy [A|b]
+    o rozmiarze (n+1,n+1), więc zużycie pamięci wynosi O(n^2 + chunk_size*n) niezależnie od m.
+    Parameters:
+      A: macierz A (m,n) (również np.memmap) albo iterowalny zbiór par (A_k, b_k) fragmentów wierszy
+      b: wektor b (m,) zawierający współczynniki po prawej stronie równania (None dla par fragmentów)
+      chunk_size: liczba wierszy przetwarzanych jednocześnie dla macierzy A
+    Results:
+    (np.ndarray, float): rozwiązanie x (n,) i norma residuum ||Ax - b||
+             Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+     """
+    if isinstance(A, np.ndarray):
+      if not isinstance(b, np.ndarray) or A.ndim != 2 or b.shape != (A.shape[0],) or not isinstance(chunk_size, int) or chunk_size <= 0:
+        return None
+      chunks = ((A[start:start + chunk_size], b[start:start + chunk_size]) for start in range(0, A.shape[0], chunk_size))
+    elif b is None:
+      chunks = A
+    else:
+      return None
 
-      Results:
-      (float)- wartość normy residuom dla podanych parametrów
-      """
-    if not isinstance(A, np.ndarray) or not isinstance(x, np.ndarray) or not isinstance(b, np.ndarray):
+    R = None
+    for A_k, b_k in chunks:
+      A_k = np.asarray(A_k, dtype=float)
+      b_k = np.asarray(b_k, dtype=float)
+      if A_k.ndim != 2 or b_k.shape != (A_k.shape[0],) or (R is not None and A_k.shape[1] != R.shape[1] - 1):
+        return None
+      block = np.column_stack((A_k, b_k))
+      if R is not None:
+        block = np.vstack((R, block))
+      R = np.linalg.qr(block, mode='r')
+    if R is None or R.shape[0] < R.shape[1] - 1:
       return None
-    else:
-      r = b - A @ x
-      return np.linalg.norm(r)
\ No newline at end of file
+    n = R.shape[1] - 1
+    x = linalg.solve_triangular(R[:n, :n], R[:n, n])
+    residual = abs(R[n, n]) if R.shape[0] > n else 0.0
+    return x, residual
@@ -1,15 +1,63 @@
 import numpy as np
 import scipy as sp
+import scipy.sparse
+import scipy.sparse.linalg
+import scipy.linalg
+import importlib.util
+import os
 import pickle
+import sys
 
-from typing import Union, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Union, List, Tuple, Optional, Callable
 
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
 
-def diag_dominant_matrix_A_b(m: int) -> Tuple[np.ndarray, np.ndarray]:
+
+def _load_lab(lab: str):
+    """Funkcja importująca moduł ../labN/main.py pod unikalną nazwą labN_main
+    (wszystkie moduły laboratoriów nazywają się main)."""
+    name = '{}_main'.format(lab)
+    if name not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, lab, 'main.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# generatory losowe i norma residuum są wspólne z lab6
+_lab6 = _load_lab('lab6')
+_seed_sequences = _lab6._seed_sequences
+_random_integers = _lab6._random_integers
+random_matrix_Ab = _lab6.random_matrix_Ab
+residual_norm = _lab6.residual_norm
+
+
+def _random_sparse(m: int, density: float, low: int, high: int, seed_seq: np.random.SeedSequence):
+    """Funkcja generująca rzadką macierz CSR (m,m) o zadanej gęstości i niezerowych wartościach
+    całkowitych z przedziału [max(low, 1), high)."""
+    rng = np.random.default_rng(seed_seq)
+    return scipy.sparse.random(m, m, density=density, format='csr', random_state=rng,
+                               data_rvs=lambda k: rng.integers(max(low, 1), high, size=k).astype(float))
+
+
+def diag_dominant_matrix_A_b(m: int, seed=None, workers: int = 1,
+                             density: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
     """Funkcja tworząca zestaw składający się z macierzy A (m,m), wektora b (m,) o losowych wartościach całkowitych z przedziału 0, 9
     Macierz A ma być diagonalnie zdominowana, tzn. wyrazy na przekątnej sa wieksze od pozostałych w danej kolumnie i wierszu
+    Wartości losowane są generatorem np.random.Generator o jawnym ziarnie (wynik powtarzalny
+    niezależnie od liczby wątków). Dla density != None zwracana jest macierz rzadka CSR.
     Parameters:
     m int: wymiary macierzy i wektora
+    seed: ziarno generatora (int, np.random.SeedSequence albo None)
+    workers int: liczba wątków generujących macierz
+    density Optional[float]: gęstość macierzy rzadkiej z przedziału (0, 1]
     
     Returns:
     Tuple[np.ndarray, np.ndarray]: macierz diagonalnie zdominowana o rozmiarze (m,m) i wektorem (m,)
@@ -17,43 +65,96 @@ def diag_dominant_matrix_A_b(m: int) -> Tuple[np.ndarray, np.ndarray]:
     """
     if not isinstance(m, int) or m <= 0:
         return None
-    A = np.random.randint(0, 9, size=(m, m))
-    b = np.random.randint(0, 9, size=(m))
-    for row in range(m):
-        sum = 0
-        for column in range(m):
-            if row != column:
-                sum += abs(A[row][column])
-            else:
-                if A[row][column] <= sum:
-                    A[row][column] += sum
+    if density is not None and not 0 < density <= 1:
+        return None
+    seq_A, seq_b = _seed_sequences(seed, 2)
+    b = np.random.default_rng(seq_b).integers(0, 9, size=(m))
+    if density is not None:
+        A = _random_sparse(m, density, 0, 9, seq_A)
+        A.setdiag(0)
+        A.eliminate_zeros()
+        A.setdiag(np.asarray(abs(A).sum(axis=1)).ravel() + 1)
+        return A, b
+    A = _random_integers((m, m), 0, 9, seq_A, workers)
+    diag = np.diag(A).copy()
+    off_diag = np.sum(np.abs(A), axis=1) - np.abs(diag)
+    weak = diag <= off_diag
+    diag[weak] += off_diag[weak] + 1
+    np.fill_diagonal(A, diag)
     return A, b
 
 
-def is_diag_dominant(A: np.ndarray) -> bool:
-    """Funkcja sprawdzająca czy macierzy A (m,m) jest diagonalnie zdominowana
+def is_diag_dominant(A: np.ndarray, rtol: float = 0.0, block_size: int = 1024,
+                     return_violation: bool = False, workers: int = 1) -> Union[bool, Tuple[bool, Tuple[int, float]]]:
+    """Funkcja sprawdzająca czy macierzy A (m,m) jest (ściśle, wierszowo) diagonalnie zdominowana,
+    tzn. |a_ii| > sum_(j != i) |a_ij| dla każdego wiersza. Sumy wierszy pasma block_size wierszy
+    składane są z kwadratowych bloków (block_size, block_size), więc zużycie pamięci nie zależy od m,
+    a macierz może być zapisana w pliku (np.memmap); może też być macierzą rzadką (CSR).
+    Bloki pasma przetwarzane są równolegle przez workers wątków (np.abs i sum zwalniają GIL),
+    a sprawdzanie kończy się po pierwszym paśmie, w którym warunek nie jest spełniony.
     Parameters:
     A np.ndarray: macierz wejściowa
+    rtol float: tolerancja względna, wiersz spełnia warunek gdy |a_ii| - sum_(j != i) |a_ij| > -rtol |a_ii|
+    block_size int: rozmiar bloku
+    return_violation bool: czy zwrócić również najgorszy wiersz (sprawdzane są wtedy wszystkie bloki)
+    workers int: liczba wątków
     
     Returns:
     bool: sprawdzenie warunku 
           Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    Tuple[int, float]: (dla return_violation=True) wiersz o najmniejszym zapasie |a_ii| - sum_(j != i) |a_ij| i ten zapas
     """
-    if not isinstance(A, np.ndarray) or len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+    if not isinstance(A, np.ndarray) and not sp.sparse.issparse(A):
+        return None
+    if len(A.shape) != 2 or A.shape[0] != A.shape[1] or not isinstance(block_size, int) or block_size <= 0:
         return None
-    diag = np.diag(np.diag(A))
-    sum_diag = np.sum(diag)
-    A = A - diag
-    for m in range(len(A)):
-        if np.sum(A[m]) >= sum_diag:
-            return False
-    return True
+    if not isinstance(workers, int) or workers <= 0:
+        return None
+
+    def check(r0: int, diag: np.ndarray, sums: np.ndarray) -> bool:
+        nonlocal worst
+        margin = 2 * diag - sums
+        k = np.argmin(margin + rtol * diag)
+        if margin[k] < worst[1]:
+            worst = (int(r0 + k), float(margin[k]))
+        return margin[k] > -rtol * diag[k]
+
+    worst = (0, np.inf)
+    if sp.sparse.issparse(A):
+        A = abs(sp.sparse.csr_matrix(A))
+        dominant = check(0, A.diagonal(), np.asarray(A.sum(axis=1)).ravel())
+        return (dominant, worst) if return_violation else dominant
 
+    def tile_sums(r0: int, c0: int) -> np.ndarray:
+        tile = np.array(A[r0:r0 + block_size, c0:c0 + block_size], dtype=float)
+        return np.abs(tile, out=tile).sum(axis=1)
 
-def symmetric_matrix_A_b(m: int) -> Tuple[np.ndarray, np.ndarray]:
+    n = A.shape[0]
+    dominant = True
+    with ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as pool:
+        mapper = pool.map if workers > 1 else map
+        for r0 in range(0, n, block_size):
+            rows = np.arange(r0, min(r0 + block_size, n))
+            sums = sum(mapper(lambda c0: tile_sums(r0, c0), range(0, n, block_size)))
+            if not check(r0, np.abs(np.asarray(A[rows, rows], dtype=float)), sums):
+                dominant = False
+                if not return_violation:
+                    return False
+    if return_violation:
+        return dominant, worst
+    return dominant
+
+
+def symmetric_matrix_A_b(m: int, seed=None, workers: int = 1,
+                         density: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
     """Funkcja tworząca zestaw składający się z macierzy A (m,m), wektora b (m,) o losowych wartościach całkowitych z przedziału 0, 9
+    Wartości losowane są generatorem np.random.Generator o jawnym ziarnie (wynik powtarzalny
+    niezależnie od liczby wątków). Dla density != None zwracana jest macierz rzadka CSR.
     Parameters:
     m int: wymiary macierzy i wektora
+    seed: ziarno generatora (int, np.random.SeedSequence albo None)
+    workers int: liczba wątków generujących macierz
+    density Optional[float]: gęstość macierzy rzadkiej z przedziału (0, 1]
     
     Returns:
     Tuple[np.ndarray, np.ndarray]: symetryczną macierz o rozmiarze (m,m) i wektorem (m,)
@@ -61,95 +162,647 @@ def symmetric_matrix_A_b(m: int) -> Tuple[np.ndarray, np.ndarray]:
     """
     if not isinstance(m, int) or m <= 0:
         return None
-    A = np.random.randint(0, 100, size=(m, m))
-    b = np.random.randint(0, 9, size=(m))
-    A_transpose = np.transpose(A)
-    for row in range(m):
-        for col in range(m):
-            if row > col:
-                A[row][col] = A_transpose[row][col]
+    if density is not None and not 0 < density <= 1:
+        return None
+    seq_A, seq_b = _seed_sequences(seed, 2)
+    b = np.random.default_rng(seq_b).integers(0, 9, size=(m))
+    if density is not None:
+        A = _random_sparse(m, density, 0, 100, seq_A)
+        A = scipy.sparse.triu(A, format='csr') + scipy.sparse.triu(A, k=1, format='csr').T
+        return A.tocsr(), b
+    A = _random_integers((m, m), 0, 100, seq_A, workers)
+    # wyrazy pod przekątną przepisywane są blokami z części nad przekątną
+    block = 1024
+    for start in range(0, m, block):
+        stop = min(start + block, m)
+        A[start:stop, :start] = A[:start, start:stop].T
+        tile = A[start:stop, start:stop]
+        tile[:] = np.triu(tile) + np.triu(tile, 1).T
     return A, b
 
 
-def is_symmetric(A: np.ndarray) -> bool:
-    """Funkcja sprawdzająca czy macierzy A (m,m) jest symetryczna
+def is_symmetric(A: np.ndarray, rtol: float = 0.0, atol: float = 0.0, block_size: int = 512,
+                 return_violation: bool = False, workers: int = 1) -> Union[bool, Tuple[bool, Tuple[int, int, float]]]:
+    """Funkcja sprawdzająca czy macierzy A (m,m) jest symetryczna, z dokładnością
+    |a_ij - a_ji| <= atol + rtol max(|a_ij|, |a_ji|). Macierz gęsta (również np.memmap) porównywana jest
+    kwadratowymi blokami A[I,J] z A[J,I]^T; bloki pasma I przetwarzane są równolegle przez workers
+    wątków, a sprawdzanie kończy się po pierwszym bloku (dla workers > 1: paśmie) z naruszeniem.
+    Macierz rzadka (CSR) porównywana jest z transpozycją w całości.
     Parameters:
     A np.ndarray: macierz wejściowa
+    rtol float: tolerancja względna
+    atol float: tolerancja bezwzględna
+    block_size int: rozmiar bloku
+    return_violation bool: czy zwrócić również najgorszą parę (sprawdzane są wtedy wszystkie bloki)
+    workers int: liczba wątków
     
     Returns:
     bool: sprawdzenie warunku 
           Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    Tuple[int, int, float]: (dla return_violation=True) wiersz, kolumna i |a_ij - a_ji| pary
+                            najbardziej przekraczającej tolerancję
     """
-    if not isinstance(A, np.ndarray) or len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+    if not isinstance(A, np.ndarray) and not sp.sparse.issparse(A):
+        return None
+    if len(A.shape) != 2 or A.shape[0] != A.shape[1] or not isinstance(block_size, int) or block_size <= 0:
         return None
-    for row in range(len(A)):
-        for col in range(len(A)):
-            if A[row][col] != A[col][row]:
-                return False
-    return True
+    if not isinstance(workers, int) or workers <= 0:
+        return None
+    symmetric = True
+    worst = (0, 0, 0.0)
+    if sp.sparse.issparse(A):
+        A = sp.sparse.csr_matrix(A, dtype=float)
+        diff = abs(A - A.T)
+        excess = (diff - rtol * abs(A).maximum(abs(A.T))).tocoo() if rtol else diff.tocoo()
+        if excess.nnz:
+            k = np.argmax(excess.data)
+            row, col = int(excess.row[k]), int(excess.col[k])
+            worst = (row, col, float(diff[row, col]))
+            symmetric = excess.data[k] <= atol
+        return (symmetric, worst) if return_violation else symmetric
+
+    def compare(i0: int, j0: int) -> Tuple[float, Tuple[int, int, float]]:
+        upper = np.asarray(A[i0:i0 + block_size, j0:j0 + block_size], dtype=float)
+        lower = np.asarray(A[j0:j0 + block_size, i0:i0 + block_size], dtype=float).T
+        diff = np.abs(upper - lower)
+        excess = diff - rtol * np.maximum(np.abs(upper), np.abs(lower)) if rtol else diff
+        k = np.argmax(excess)
+        row, col = divmod(int(k), diff.shape[1])
+        return excess.flat[k], (i0 + row, j0 + col, float(diff.flat[k]))
+
+    n = A.shape[0]
+    worst_excess = -np.inf
+    with ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as pool:
+        mapper = pool.map if workers > 1 else map
+        for i0 in range(0, n, block_size):
+            for excess, pair in mapper(lambda j0: compare(i0, j0), range(i0, n, block_size)):
+                if excess > worst_excess:
+                    worst_excess = excess
+                    worst = pair
+                if excess > atol:
+                    symmetric = False
+                    if not return_violation:
+                        return False
+    if return_violation:
+        return symmetric, worst
+    return symmetric
 
 
 def solve_jacobi(A: np.ndarray, b: np.ndarray, x_init: np.ndarray,
-                 epsilon: Optional[float] = 1e-8, maxiter: Optional[int] = 100) -> Tuple[np.ndarray, int]:
-    """Funkcja tworząca zestaw składający się z macierzy A (m,m), wektora b (m,) o losowych wartościach całkowitych
+                 epsilon: Optional[float] = 1e-8, maxiter: Optional[int] = 100,
+                 method: str = 'jacobi', omega: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja rozwiązująca układ Ax = b stacjonarną metodą iteracyjną (Jacobiego, Gaussa-Seidla lub SOR).
+    Przekątna przechowywana jest jako wektor, a macierz A może być gęsta (np.ndarray) lub rzadka
+    (scipy.sparse, przekształcana do CSR). Iteracje wykonywane są w miejscu, w buforach
+    zaalokowanych przed pętlą, a historia norm jest zapisywana w zaalokowanym wcześniej wektorze.
+    Dla wielu prawych stron b (m,k) każda iteracja wykonuje jeden iloczyn macierz-macierz,
+    zbieżność sprawdzana jest dla każdej kolumny osobno, a kolumny zbieżne są zamrażane
+    i pomijane w kolejnych iteracjach.
+    - 'jacobi': x_new = (b - (A - D) x) / D
+    - 'gauss-seidel': (D + L) x_new = b - U x
+    - 'sor': (D + omega L) x_new = omega b - (omega U + (omega - 1) D) x, 0 < omega < 2
     Parameters:
     A np.ndarray: macierz współczynników
+    b np.ndarray: wektor (m,) lub macierz (m,k) wartości prawej strony układu
+    x_init np.ndarray: rozwiązanie początkowe o rozmiarze b
+    epsilon Optional[float]: zadana dokładność
+    maxiter Optional[int]: ograniczenie iteracji
+    method str: metoda iteracyjna 'jacobi', 'gauss-seidel' albo 'sor'
+    omega float: współczynnik relaksacji metody SOR
+    
+    Returns:
+    np.ndarray: przybliżone rozwiązanie (m,) lub (m,k)
+                Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    np.ndarray: normy ||x_k - x_(k-1)|| w kolejnych iteracjach, dla b (m,k) macierz (iteracje,k),
+                w której po osiągnięciu zbieżności kolumny wpisywane jest np.nan
+    """
+    if not isinstance(A, np.ndarray) and not sp.sparse.issparse(A):
+        return None
+    if not isinstance(b, np.ndarray) or not isinstance(x_init, np.ndarray) or not isinstance(epsilon, float) or not isinstance(maxiter, int):
+        return None
+    if A.shape[0] != A.shape[1] or x_init.shape != b.shape or b.ndim not in (1, 2) or b.shape[0] != A.shape[0]:
+        return None
+    if method not in ('jacobi', 'gauss-seidel', 'sor') or not 0 < omega < 2:
+        return None
+    if method == 'gauss-seidel':
+        omega = 1.0
+    sparse = sp.sparse.issparse(A)
+    if sparse:
+        A = sp.sparse.csr_matrix(A)
+    n = A.shape[0]
+    diag = A.diagonal().astype(float)
+
+    if method != 'jacobi':
+        # układ (L + D / omega) x_new = b - U x - (1 - 1 / omega) D x, równoważny postaci z omega L
+        if sparse:
+            M = (sp.sparse.tril(A, k=-1) + sp.sparse.diags(diag / omega)).tocsr()
+            U = sp.sparse.triu(A, k=1, format='csr')
+        else:
+            # jedna tablica (m,m), dla Gaussa-Seidla i macierzy float64 bez kopiowania: solve_triangular
+            # czyta tylko jej dolny trójkąt, a U x liczone jest przez BLAS trmm z górnego trójkąta
+            if omega == 1.0:
+                M = np.ascontiguousarray(A, dtype=float)
+            else:
+                M = np.array(A, dtype=float, order='C')
+                M[np.diag_indices(n)] = diag / omega
+    else:
+        # jednorazowa konwersja macierzy całkowitoliczbowej zamiast konwersji w każdym iloczynie
+        U = A if np.issubdtype(A.dtype, np.floating) else A.astype(float)
+
+    # prawe strony przechowywane są wierszami (k,m), dzięki czemu aktywne kolumny
+    # zajmują zawsze ciągły początkowy fragment buforów
+    B = np.array(b.reshape(n, -1).T, dtype=float, order='C')
+    X = np.array(x_init.reshape(n, -1).T, dtype=float, order='C')
+    k = B.shape[0]
+    X_new = np.empty((k, n))
+    AX = np.empty((k, n))
+    tmp = np.empty((k, n))
+    solution = np.empty((k, n))
+    resid = np.full((maxiter, k), np.nan)
+    active = np.arange(k)
+    iterations = 0
+    for i in range(maxiter):
+        ka = active.size
+        x, x_new, Ax, t, b_a = X[:ka], X_new[:ka], AX[:ka], tmp[:ka], B[:ka]
+        if sparse:
+            Ax[:] = (U @ x.T).T
+        elif method == 'jacobi':
+            np.dot(x, U.T, out=Ax)
+        else:
+            # U x = (triu(A, 1) + I) x - x, M^T jest w układzie Fortrana, więc trmm nie kopiuje macierzy
+            Ax[:] = sp.linalg.blas.dtrmm(1.0, M.T, x.T, lower=1, trans_a=1, diag=1).T
+            Ax -= x
+        if method == 'jacobi':
+            np.multiply(diag, x, out=t)
+            np.subtract(Ax, t, out=Ax)
+            np.subtract(b_a, Ax, out=x_new)
+            np.divide(x_new, diag, out=x_new)
+        else:
+            # prawa strona: b - U x - (1 - 1 / omega) D x
+            np.subtract(b_a, Ax, out=t)
+            if omega != 1.0:
+                np.multiply(diag, x, out=Ax)
+                Ax *= 1 - 1 / omega
+                t -= Ax
+            if sparse:
+                x_new[:] = sp.sparse.linalg.spsolve_triangular(M, t.T, lower=True).T
+            else:
+                x_new[:] = sp.linalg.solve_triangular(M, t.T, lower=True, check_finite=False).T
+        np.subtract(x_new, x, out=t)
+        r_norm = np.linalg.norm(t, axis=1)
+        resid[i, active] = r_norm
+        X, X_new = X_new, X
+        iterations = i + 1
+        converged = r_norm < epsilon
+        if converged.any():
+            # zamrożenie zbieżnych kolumn i przesunięcie pozostałych na początek buforów
+            solution[active[converged]] = X[:ka][converged]
+            keep = ~converged
+            X[:keep.sum()] = X[:ka][keep]
+            B[:keep.sum()] = B[:ka][keep]
+            active = active[keep]
+            if active.size == 0:
+                break
+    solution[active] = X[:active.size]
+    if b.ndim == 1:
+        return solution[0], resid[:iterations, 0]
+    return solution.T, resid[:iterations]
+
+
+class BlockJacobi:
+    """Rozkład do blokowej metody Jacobiego. Niewiadome dzielone są na n_blocks bloków wierszy
+    (domyślnie bloków po block_size wierszy - podział nie zależy od liczby wątków, więc przebieg
+    iteracji jest taki sam dla każdego workers), a bloki przekątniowe A_II są jednorazowo rozkładane (LU).
+    Rozkład można wykorzystać w wielu wywołaniach solve (np. dla różnych prawych stron).
+    
+    Parameters:
+    A np.ndarray: macierz współczynników (gęsta lub rzadka) (m,m)
+    n_blocks Optional[int]: liczba bloków, domyślnie ceil(m / block_size)
+    block_size int: docelowy rozmiar bloku używany gdy n_blocks nie jest podane
+    """
+
+    def __init__(self, A: np.ndarray, n_blocks: Optional[int] = None, block_size: int = 512):
+        if not isinstance(A, np.ndarray) and not sp.sparse.issparse(A):
+            raise ValueError('A musi być macierzą gęstą (np.ndarray) lub rzadką')
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError('A musi być macierzą kwadratową')
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise ValueError('block_size musi być dodatnią liczbą całkowitą')
+        n = A.shape[0]
+        if n_blocks is None:
+            n_blocks = max(1, -(-n // block_size))
+        if not isinstance(n_blocks, int) or not 0 < n_blocks <= n:
+            raise ValueError('n_blocks musi być liczbą całkowitą z przedziału [1, m]')
+        self.sparse = sp.sparse.issparse(A)
+        if self.sparse:
+            A = sp.sparse.csr_matrix(A, dtype=float)
+        elif not np.issubdtype(A.dtype, np.floating):
+            A = A.astype(float)
+        bounds = np.linspace(0, n, n_blocks + 1).astype(int)
+        self.blocks = list(zip(bounds[:-1], bounds[1:]))
+        self.rows = [A[start:stop] for start, stop in self.blocks]
+        # ciągła kopia bloku - np.dot na wycinku A[start:stop, start:stop] kopiowałby go w każdej iteracji
+        self.diag_blocks = [A[start:stop, start:stop] if self.sparse else np.ascontiguousarray(A[start:stop, start:stop])
+                            for start, stop in self.blocks]
+        self.factors = []
+        for block in self.diag_blocks:
+            if self.sparse:
+                try:
+                    self.factors.append(sp.sparse.linalg.splu(sp.sparse.csc_matrix(block)))
+                except RuntimeError:
+                    raise ValueError('blok przekątniowy A jest osobliwy')
+            else:
+                lu_piv = sp.linalg.lu_factor(block, check_finite=False)
+                if np.any(np.diag(lu_piv[0]) == 0):
+                    raise ValueError('blok przekątniowy A jest osobliwy')
+                self.factors.append(lu_piv)
+        self.shape = A.shape
+
+    def _sweep(self, k: int, b: np.ndarray, x: np.ndarray, x_new: np.ndarray, r: np.ndarray) -> None:
+        start, stop = self.blocks[k]
+        r_k = r[start:stop]
+        if self.sparse:
+            r_k[:] = self.rows[k] @ x
+            r_k -= self.diag_blocks[k] @ x[start:stop]
+        else:
+            np.dot(self.rows[k], x, out=r_k)
+            r_k -= np.dot(self.diag_blocks[k], x[start:stop])
+        np.subtract(b[start:stop], r_k, out=r_k)
+        if self.sparse:
+            x_new[start:stop] = self.factors[k].solve(r_k)
+        else:
+            x_new[start:stop] = sp.linalg.lu_solve(self.factors[k], r_k, check_finite=False)
+
+    def solve(self, b: np.ndarray, x_init: np.ndarray, epsilon: float = 1e-8, maxiter: int = 100,
+              workers: int = 1, blas_threads: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Funkcja wykonująca iteracje x_new_I = A_II^-1 (b_I - A_I x + A_II x_I). Bloki przetwarzane są
+        równolegle przez workers wątków (iloczyny BLAS i rozwiązania LAPACK zwalniają GIL), które zapisują
+        wyniki do wspólnych buforów. Aby wątki nie uruchamiały jednocześnie wielowątkowego BLAS
+        (nadsubskrypcja rdzeni), na czas obliczeń liczba wątków BLAS ograniczana jest do blas_threads
+        (wymaga pakietu threadpoolctl, bez niego ograniczenie należy ustawić zmienną środowiskową,
+        np. OPENBLAS_NUM_THREADS).
+        
+        Parameters:
+        b np.ndarray: wektor wartości prawej strony układu (m,)
+        x_init np.ndarray: rozwiązanie początkowe (m,)
+        epsilon float: zadana dokładność
+        maxiter int: ograniczenie iteracji
+        workers int: liczba wątków, nie większa niż liczba bloków
+        blas_threads Optional[int]: liczba wątków BLAS na wątek roboczy, domyślnie liczba rdzeni / workers
+        
+        Returns:
+        np.ndarray: przybliżone rozwiązanie (m,)
+        np.ndarray: normy ||x_k - x_(k-1)|| w kolejnych iteracjach
+        """
+        if not isinstance(b, np.ndarray) or not isinstance(x_init, np.ndarray) or b.shape != (self.shape[0],) or x_init.shape != b.shape:
+            raise ValueError('b i x_init muszą mieć postać (m,)')
+        if not isinstance(epsilon, float) or not isinstance(maxiter, int) or maxiter <= 0:
+            raise ValueError('epsilon musi być liczbą zmiennoprzecinkową, a maxiter dodatnią liczbą całkowitą')
+        if not isinstance(workers, int) or not 0 < workers <= len(self.blocks):
+            raise ValueError('workers musi być liczbą całkowitą z przedziału [1, n_blocks]')
+        if blas_threads is None:
+            blas_threads = max(1, (os.cpu_count() or 1) // workers)
+        if not isinstance(blas_threads, int) or blas_threads <= 0:
+            raise ValueError('blas_threads musi być dodatnią liczbą całkowitą')
+        b = b.astype(float)
+        x = x_init.astype(float)
+        x_new = np.empty(self.shape[0])
+        r = np.empty(self.shape[0])
+        resid = np.empty(maxiter)
+        iterations = 0
+        if workers > 1 and threadpool_limits is not None:
+            limits = threadpool_limits(limits=blas_threads, user_api='blas')
+        else:
+            limits = nullcontext()
+        with limits, ThreadPoolExecutor(max_workers=workers) as pool:
+            for i in range(maxiter):
+                if workers == 1:
+                    for k in range(len(self.blocks)):
+                        self._sweep(k, b, x, x_new, r)
+                else:
+                    for future in [pool.submit(self._sweep, k, b, x, x_new, r) for k in range(len(self.blocks))]:
+                        future.result()
+                np.subtract(x_new, x, out=r)
+                resid[i] = np.linalg.norm(r)
+                x, x_new = x_new, x
+                iterations = i + 1
+                if resid[i] < epsilon:
+                    break
+        return x, resid[:iterations]
+
+
+def solve_block_jacobi(A: np.ndarray, b: np.ndarray, x_init: np.ndarray,
+                       epsilon: Optional[float] = 1e-8, maxiter: Optional[int] = 100,
+                       n_blocks: Optional[int] = None, block_size: int = 512, workers: int = 1,
+                       blas_threads: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja rozwiązująca układ Ax = b blokową metodą Jacobiego (rozkład BlockJacobi i iteracje
+    BlockJacobi.solve). Przy wielu układach z tą samą macierzą A rozkład warto utworzyć raz.
+    Parameters:
+    A np.ndarray: macierz współczynników (gęsta lub rzadka)
     b np.ndarray: wektor wartości prawej strony układu
     x_init np.ndarray: rozwiązanie początkowe
     epsilon Optional[float]: zadana dokładność
     maxiter Optional[int]: ograniczenie iteracji
+    n_blocks Optional[int]: liczba bloków, domyślnie ceil(m / block_size), nie mniejsza niż workers
+    block_size int: docelowy rozmiar bloku używany gdy n_blocks nie jest podane
+    workers int: liczba wątków
+    blas_threads Optional[int]: liczba wątków BLAS na wątek roboczy, domyślnie liczba rdzeni / workers
+    
+    Returns:
+    np.ndarray: przybliżone rozwiązanie (m,)
+                Jeżeli dane wejściowe niepoprawne (w tym n_blocks < workers) lub blok przekątniowy jest osobliwy funkcja zwraca None
+    np.ndarray: normy ||x_k - x_(k-1)|| w kolejnych iteracjach
+    """
+    try:
+        return BlockJacobi(A, n_blocks, block_size).solve(b, x_init, epsilon, maxiter, workers, blas_threads)
+    except ValueError:
+        return None
+
+
+def _as_matvec(A) -> Callable[[np.ndarray], np.ndarray]:
+    """Funkcja zwracająca funkcję x -> A x dla macierzy gęstej, rzadkiej, operatora liniowego
+    (obiektu z metodą matvec lub operatorem @) albo funkcji."""
+    if hasattr(A, 'matvec'):
+        return A.matvec
+    if callable(A) and not hasattr(A, 'shape'):
+        return A
+    return lambda x: A @ x
+
+
+def jacobi_preconditioner(A) -> Callable[[np.ndarray], np.ndarray]:
+    """Funkcja tworząca preconditioner Jacobiego M^-1 r = r / diag(A).
+    Parameters:
+    A: macierz gęsta lub rzadka (m,m) o niezerowej przekątnej
+    
+    Returns:
+    Callable: funkcja r -> M^-1 r
+              Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    """
+    if not isinstance(A, np.ndarray) and not sp.sparse.issparse(A):
+        return None
+    diag = A.diagonal().astype(float)
+    if np.any(diag == 0):
+        return None
+    inv_diag = 1 / diag
+    return lambda r: inv_diag * r
+
+
+# minimalne wypełnienie dolnego trójkąta macierzy rzadkiej, od którego IC(0) liczone jest jako pełny rozkład Choleskiego
+ICHOL_DENSE_FRACTION = 0.1
+
+
+def ichol_preconditioner(A) -> Callable[[np.ndarray], np.ndarray]:
+    """Funkcja tworząca preconditioner niepełnego rozkładu Choleskiego IC(0): A ~ L L^T, gdzie L ma
+    ten sam wzór zer co dolny trójkąt macierzy A. Wiersz i czynnika wyznaczany jest przez scalenie
+    posortowanego wzoru wiersza i (rozproszonego w wektorze roboczym) z wierszami k < i, więc koszt
+    to O(sum |wiersz k|) zamiast przecinania zbiorów indeksów dla każdego elementu; zastosowanie to dwa
+    rozwiązania układów trójkątnych (SuperLU z naturalną kolejnością, bez wyboru elementu głównego).
+    Dla macierzy gęstej (np.ndarray) oraz rzadkiej o dolnym trójkącie wypełnionym co najmniej
+    w ICHOL_DENSE_FRACTION wzór traktowany jest jako pełny - IC(0) jest wtedy zwykłym rozkładem
+    Choleskiego liczonym przez LAPACK, bo pętla po elementach miałaby koszt O(m^3) w Pythonie.
+    Parameters:
+    A: symetryczna, dodatnio określona macierz gęsta lub rzadka (m,m)
+    
+    Returns:
+    Callable: funkcja r -> (L L^T)^-1 r
+              Jeżeli dane wejściowe niepoprawne lub rozkład się załamie funkcja zwraca None
+    """
+    if not isinstance(A, np.ndarray) and not sp.sparse.issparse(A):
+        return None
+    if len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+        return None
+    n = A.shape[0]
+    if sp.sparse.issparse(A):
+        L = sp.sparse.tril(sp.sparse.csr_matrix(A, dtype=float), format='csr')
+        L.sum_duplicates()
+        L.sort_indices()
+        dense = L.nnz >= ICHOL_DENSE_FRACTION * n * (n + 1) / 2
+    else:
+        dense = True
+    if dense:
+        try:
+            factor = sp.linalg.cholesky(L.toarray() if sp.sparse.issparse(A) else np.asarray(A, dtype=float),
+                                        lower=True, check_finite=False)
+        except np.linalg.LinAlgError:
+            return None
+        return lambda r: sp.linalg.cho_solve((factor, True), r, check_finite=False)
+
+    indptr = L.indptr.tolist()
+    indices = L.indices.tolist()
+    values = L.data.tolist()
+    work = [0.0] * n
+    for i in range(n):
+        start, diag = indptr[i], indptr[i + 1] - 1
+        if diag < start or indices[diag] != i:
+            return None
+        for p in range(start, diag + 1):
+            work[indices[p]] = values[p]
+        square_sum = 0.0
+        for p in range(start, diag):
+            # l_ik = (a_ik - sum_j l_ij l_kj) / l_kk, l_ij spoza wzoru wiersza i są w work zerami
+            k = indices[p]
+            k_diag = indptr[k + 1] - 1
+            l_ik = work[k]
+            for q in range(indptr[k], k_diag):
+                l_ik -= values[q] * work[indices[q]]
+            l_ik /= values[k_diag]
+            work[k] = l_ik
+            values[p] = l_ik
+            square_sum += l_ik * l_ik
+        pivot = work[i] - square_sum
+        if pivot <= 0:
+            return None
+        values[diag] = pivot ** 0.5
+        for p in range(start, diag + 1):
+            work[indices[p]] = 0.0
+    L.data[:] = values
+    lu = sp.sparse.linalg.splu(L.tocsc(), permc_spec='NATURAL', diag_pivot_thresh=0.0,
+                               options=dict(SymmetricMode=True))
+    return lambda r: lu.solve(lu.solve(r), trans='T')
+
+
+def solve_cg(A, b: np.ndarray, x_init: np.ndarray, epsilon: Optional[float] = 1e-8, maxiter: Optional[int] = 100,
+             M: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja rozwiązująca układ Ax = b (A symetryczna, dodatnio określona) metodą gradientów sprzężonych,
+    z opcjonalnym preconditionerem M (np. jacobi_preconditioner, ichol_preconditioner).
+    Macierz A używana jest wyłącznie przez iloczyn A @ x, więc może być gęsta, rzadka,
+    strukturalna, zapisana w pliku (np.memmap), być operatorem liniowym lub funkcją x -> Ax.
+    Parameters:
+    A: macierz współczynników lub operator
+    b np.ndarray: wektor wartości prawej strony układu
+    x_init np.ndarray: rozwiązanie początkowe
+    epsilon Optional[float]: zadana dokładność (norma residuum)
+    maxiter Optional[int]: ograniczenie iteracji
+    M Optional[Callable]: preconditioner r -> M^-1 r
     
     Returns:
     np.ndarray: przybliżone rozwiązanie (m,)
                 Jeżeli dane wejściowe niepoprawne funkcja zwraca None
-    int: iteracja
+    np.ndarray: normy residuum ||b - A x_k|| w kolejnych iteracjach (liczba iteracji = długość wektora)
     """
-    if not isinstance(A, np.ndarray) or not isinstance(b, np.ndarray) or not isinstance(x_init, np.ndarray) or not isinstance(epsilon, float) or not isinstance(maxiter, int):
+    if not isinstance(b, np.ndarray) or not isinstance(x_init, np.ndarray) or x_init.shape != b.shape or b.ndim != 1:
         return None
-    if A.shape[0] != A.shape[1] or x_init.shape != b.shape:
+    if not isinstance(epsilon, float) or not isinstance(maxiter, int):
         return None
-    D = np.diag(np.diag(A))
-    LU = A - D
-    D_inv = np.diag(1 / np.diag(D))
-    resid = []
+    matvec = _as_matvec(A)
+    precond = M if M is not None else (lambda r: r)
+    x = x_init.astype(float)
+    r = b - matvec(x)
+    resid = np.empty(maxiter)
+    if np.linalg.norm(r) < epsilon:
+        return x, resid[:0]
+    z = precond(r)
+    p = z.copy()
+    rz = r @ z
     for i in range(maxiter):
-        x_new = np.dot(D_inv, b - np.dot(LU, x_init))
-        r_norm = np.linalg.norm(x_new - x_init)
-        resid.append(r_norm)
-        if r_norm < epsilon:
-            return x_new, resid
-        x_init = x_new
-    return x_init, resid
+        Ap = matvec(p)
+        pAp = p @ Ap
+        if pAp == 0:
+            # załamanie metody (p należy do jądra A), dalsze iteracje nie zmienią x
+            return x, resid[:i]
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        resid[i] = np.linalg.norm(r)
+        if resid[i] < epsilon:
+            return x, resid[:i + 1]
+        z = precond(r)
+        rz_new = r @ z
+        p *= rz_new / rz
+        p += z
+        rz = rz_new
+    return x, resid[:maxiter]
 
 
-def random_matrix_Ab(m:int):
-    """Funkcja tworząca zestaw składający się z macierzy A (m,m) i wektora b (m,)  zawierających losowe wartości
+def solve_gmres(A, b: np.ndarray, x_init: np.ndarray, epsilon: Optional[float] = 1e-8, maxiter: Optional[int] = 100,
+                restart: int = 30, M: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja rozwiązująca układ Ax = b metodą GMRES z restartem co restart iteracji
+    (ortogonalizacja Grama-Schmidta z reortogonalizacją, obroty Givensa) i opcjonalnym
+    prawostronnym preconditionerem M. Macierz A używana jest wyłącznie przez iloczyn A @ x.
     Parameters:
-    m(int): rozmiar macierzy
-    Results:
-    (np.ndarray, np.ndarray): macierz o rozmiarze (m,m) i wektorem (m,)
+    A: macierz współczynników lub operator
+    b np.ndarray: wektor wartości prawej strony układu
+    x_init np.ndarray: rozwiązanie początkowe
+    epsilon Optional[float]: zadana dokładność (norma residuum)
+    maxiter Optional[int]: ograniczenie łącznej liczby iteracji
+    restart int: wymiar podprzestrzeni Kryłowa przed restartem
+    M Optional[Callable]: preconditioner r -> M^-1 r
+    
+    Returns:
+    np.ndarray: przybliżone rozwiązanie (m,)
                 Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    np.ndarray: normy residuum w kolejnych iteracjach (liczba iteracji = długość wektora)
     """
-    if not isinstance(m, int) or m <= 0:
+    if not isinstance(b, np.ndarray) or not isinstance(x_init, np.ndarray) or x_init.shape != b.shape or b.ndim != 1:
         return None
-    else:
-        A = np.random.randint(0, 100, size=(m, m))
-        b = np.random.randint(0, 100, size=(m,))
-    return A, b
+    if not isinstance(epsilon, float) or not isinstance(maxiter, int) or not isinstance(restart, int) or restart <= 0:
+        return None
+    matvec = _as_matvec(A)
+    precond = M if M is not None else (lambda r: r)
+    n = b.size
+    x = x_init.astype(float)
+    V = np.empty((restart + 1, n))
+    H = np.zeros((restart + 1, restart))
+    cs = np.empty(restart)
+    sn = np.empty(restart)
+    g = np.empty(restart + 1)
+    resid = np.empty(maxiter)
+    it = 0
+    while it < maxiter:
+        r = b - matvec(x)
+        beta = np.linalg.norm(r)
+        if beta < epsilon:
+            break
+        V[0] = r / beta
+        H[:] = 0
+        g[:] = 0
+        g[0] = beta
+        k = 0
+        for j in range(restart):
+            w = matvec(precond(V[j]))
+            for _ in range(2):
+                h = V[:j + 1] @ w
+                w -= V[:j + 1].T @ h
+                H[:j + 1, j] += h
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 0:
+                V[j + 1] = w / H[j + 1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            denom = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / denom, H[j + 1, j] / denom
+            H[j, j] = denom
+            H[j + 1, j] = 0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+            resid[it] = abs(g[j + 1])
+            it += 1
+            k = j + 1
+            if resid[it - 1] < epsilon or it >= maxiter:
+                break
+        y = sp.linalg.solve_triangular(H[:k, :k], g[:k])
+        x += precond(V[:k].T @ y)
+        if resid[it - 1] < epsilon:
+            break
+    return x, resid[:it]
 
 
-def residual_norm(A: np.ndarray, x: np.ndarray, b: np.ndarray):
-    """Funkcja obliczająca normę residuum dla równania postaci:
-    Ax = b
-      Parameters:
-      A: macierz A (m,n) zawierająca współczynniki równania
-      x: wektor x (n,) zawierający rozwiązania równania
-      b: wektor b (m,) zawierający współczynniki po prawej stronie równania
-      Results:
-      (float)- wartość normy residuom dla podanych parametrów
-      """
-    if not isinstance(A, np.ndarray) or not isinstance(x, np.ndarray) or not isinstance(b, np.ndarray):
-      return None
-    else:
-      r = b - A @ x
-      return np.linalg.norm(r)
\ No newline at end of file
+def solve_bicgstab(A, b: np.ndarray, x_init: np.ndarray, epsilon: Optional[float] = 1e-8, maxiter: Optional[int] = 100,
+                   M: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Funkcja rozwiązująca układ Ax = b (dowolna macierz nieosobliwa) metodą BiCGSTAB
+    z opcjonalnym preconditionerem M. Macierz A używana jest wyłącznie przez iloczyn A @ x.
+    Parameters:
+    A: macierz współczynników lub operator
+    b np.ndarray: wektor wartości prawej strony układu
+    x_init np.ndarray: rozwiązanie początkowe
+    epsilon Optional[float]: zadana dokładność (norma residuum)
+    maxiter Optional[int]: ograniczenie iteracji
+    M Optional[Callable]: preconditioner r -> M^-1 r
+    
+    Returns:
+    np.ndarray: przybliżone rozwiązanie (m,)
+                Jeżeli dane wejściowe niepoprawne funkcja zwraca None
+    np.ndarray: normy residuum ||b - A x_k|| w kolejnych iteracjach (liczba iteracji = długość wektora)
+    """
+    if not isinstance(b, np.ndarray) or not isinstance(x_init, np.ndarray) or x_init.shape != b.shape or b.ndim != 1:
+        return None
+    if not isinstance(epsilon, float) or not isinstance(maxiter, int):
+        return None
+    matvec = _as_matvec(A)
+    precond = M if M is not None else (lambda r: r)
+    x = x_init.astype(float)
+    r = b - matvec(x)
+    resid = np.empty(maxiter)
+    if np.linalg.norm(r) < epsilon:
+        return x, resid[:0]
+    r_hat = r.copy()
+    rho = alpha = omega = 1.0
+    v = np.zeros_like(r)
+    p = np.zeros_like(r)
+    for i in range(maxiter):
+        rho_new = r_hat @ r
+        if rho_new == 0:
+            return x, resid[:i]
+        beta = (rho_new / rho) * (alpha / omega)
+        rho = rho_new
+        p = r + beta * (p - omega * v)
+        p_hat = precond(p)
+        v = matvec(p_hat)
+        r_hat_v = r_hat @ v
+        if r_hat_v == 0:
+            return x, resid[:i]
+        alpha = rho / r_hat_v
+        s = r - alpha * v
+        if np.linalg.norm(s) < epsilon:
+            x += alpha * p_hat
+            resid[i] = np.linalg.norm(s)
+            return x, resid[:i + 1]
+        s_hat = precond(s)
+        t = matvec(s_hat)
+        omega = (t @ s) / (t @ t)
+        x += alpha * p_hat + omega * s_hat
+        r = s - omega * t
+        resid[i] = np.linalg.norm(r)
+        if resid[i] < epsilon:
+            return x, resid[:i + 1]
+    return x, resid[:maxiter]